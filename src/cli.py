@@ -1,12 +1,15 @@
 from __future__ import annotations
 
-import json
+import importlib
 import logging
-from datetime import datetime
+import os
+import time
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
 import typer
+from pydantic import ValidationError
 
 from src.models import Property
 from src.scrapers.base import BaseScraper
@@ -15,28 +18,72 @@ app = typer.Typer(help="Mirascraper - Valencia property scraper")
 logger = logging.getLogger(__name__)
 
 
+# source name → "module:ClassName"; modules are imported lazily so CLI
+# startup doesn't pay for every scraper's dependencies
+_SCRAPERS = {
+    "idealista": "src.scrapers.idealista:IdealistaScraper",
+    "spain-real-estate": "src.scrapers.spain_real_estate:SpainRealEstateScraper",
+    "pisos-com": "src.scrapers.pisos_com:PisosComScraper",
+    "fotocasa": "src.scrapers.fotocasa:FotocasaScraper",
+    "habitaclia": "src.scrapers.habitaclia:HabitacliaScraper",
+}
+
+
+@lru_cache(maxsize=None)
+def _scraper_class(source: str) -> type[BaseScraper]:
+    module_name, _, class_name = _SCRAPERS[source].partition(":")
+    return getattr(importlib.import_module(module_name), class_name)
+
+
 def _get_scraper(source: str) -> BaseScraper:
     """Return the right scraper instance for the given source."""
-    if source == "idealista":
-        from src.scrapers.idealista import IdealistaScraper
-        return IdealistaScraper()
-    if source == "spain-real-estate":
-        from src.scrapers.spain_real_estate import SpainRealEstateScraper
-        return SpainRealEstateScraper()
-    if source == "pisos-com":
-        from src.scrapers.pisos_com import PisosComScraper
-        return PisosComScraper()
-    if source == "fotocasa":
-        from src.scrapers.fotocasa import FotocasaScraper
-        return FotocasaScraper()
-    if source == "habitaclia":
-        from src.scrapers.habitaclia import HabitacliaScraper
-        return HabitacliaScraper()
-    typer.echo(f"Unknown source: {source}. Available: idealista, spain-real-estate, pisos-com, fotocasa, habitaclia")
-    raise typer.Exit(code=1)
+    if source not in _SCRAPERS:
+        typer.echo(f"Unknown source: {source}. Available: {', '.join(_SCRAPERS)}")
+        raise typer.Exit(code=1)
+    return _scraper_class(source)()
+
+
+def _to_json_line(prop: Property) -> bytes:
+    """Serialize a Property to JSON bytes via the pydantic-core Rust serializer.
+
+    Skips the str round-trip of ``model_dump_json()`` — for big dumps the
+    per-row UTF-8 encode adds up.
+    """
+    return Property.__pydantic_serializer__.to_json(prop)
+
+
+def _load_jsonl(path: Path) -> list[Property]:
+    """Read a JSONL file into Property objects in one bulk read."""
+    return [
+        Property.model_validate_json(line)
+        for line in path.read_bytes().splitlines()
+        if line
+    ]
+
+
+def _save_jsonl(path: Path, properties: list[Property]) -> None:
+    """Write properties to path atomically (write temp → rename).
+
+    The whole file is emitted as one write() call and we deliberately skip
+    fsync before the rename: an os-level crash can at worst lose the latest
+    checkpoint of re-scrapeable data, and fsync on every enrich checkpoint
+    would stall the loop on slow disks.
+    """
+    tmp = path.with_suffix(".jsonl.tmp")
+    with open(tmp, "wb") as f:
+        f.write(b"\n".join(_to_json_line(p) for p in properties) + b"\n")
+    os.replace(tmp, path)
+
+
+_logging_configured = False
 
 
 def _setup_logging(verbose: bool = False) -> None:
+    global _logging_configured
+    if _logging_configured:
+        return
+    _logging_configured = True
+
     level = logging.DEBUG if verbose else logging.INFO
     logging.basicConfig(
         format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
@@ -72,12 +119,10 @@ def scrape(
         typer.echo("No properties found.")
         raise typer.Exit(0)
 
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    timestamp = time.strftime("%Y%m%d_%H%M%S")
     filename = output / f"{source}_{listing_type}_{timestamp}.jsonl"
 
-    with open(filename, "w", encoding="utf-8") as f:
-        for prop in properties:
-            f.write(prop.model_dump_json() + "\n")
+    _save_jsonl(filename, properties)
 
     typer.echo(f"Saved {len(properties)} properties to {filename}")
 
@@ -93,12 +138,7 @@ def sync(
         typer.echo(f"File not found: {input_file}")
         raise typer.Exit(1)
 
-    properties: list[Property] = []
-    with open(input_file, "r", encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if line:
-                properties.append(Property.model_validate_json(line))
+    properties = _load_jsonl(input_file)
 
     typer.echo(f"Loaded {len(properties)} properties from {input_file}")
 
@@ -142,7 +182,7 @@ def run(
         raise typer.Exit(0)
 
     # Save JSONL
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    timestamp = time.strftime("%Y%m%d_%H%M%S")
     if name:
         base = Path(name)
         if base.suffix != ".jsonl":
@@ -151,9 +191,7 @@ def run(
     else:
         filename = output / f"{source}_{listing_type}_{timestamp}.jsonl"
 
-    with open(filename, "w", encoding="utf-8") as f:
-        for prop in properties:
-            f.write(prop.model_dump_json() + "\n")
+    _save_jsonl(filename, properties)
 
     typer.echo(f"Saved {len(properties)} properties to {filename}")
 
@@ -165,26 +203,109 @@ def run(
     typer.echo(f"Upserted {tr_count} translations to Supabase.")
 
 
-def _save_jsonl(path: Path, properties: list[Property]) -> None:
-    """Write properties to path atomically (write temp → rename)."""
-    import os
-    tmp = path.with_suffix(".jsonl.tmp")
-    with open(tmp, "w", encoding="utf-8") as f:
-        for p in properties:
-            f.write(p.model_dump_json() + "\n")
-    os.replace(tmp, path)
+def _journal_path(path: Path) -> Path:
+    """Sidecar file where enrich appends finished rows as it goes."""
+    return path.with_suffix(".jsonl.part")
+
+
+def _apply_journal(path: Path, properties: list[Property]) -> int:
+    """Merge rows left behind by an interrupted enrich run.
+
+    Appending each enriched row to the journal costs O(row) per property,
+    where rewriting the whole file at every checkpoint would cost O(N²)
+    bytes over a run. The journal is folded back in here on resume and
+    deleted once the main file has been rewritten.
+    """
+    journal = _journal_path(path)
+    if not journal.exists():
+        return 0
+    index = {p.id: i for i, p in enumerate(properties)}
+    merged = 0
+    for line in journal.read_bytes().splitlines():
+        if not line:
+            continue
+        try:
+            prop = Property.model_validate_json(line)
+        except ValidationError:
+            # A torn final line means the previous run died mid-append —
+            # exactly the interruption the journal exists to survive.
+            # Everything before it is intact; keep that and stop merging.
+            logger.warning(
+                "Journal %s ends in a truncated row — recovered %d rows before it",
+                journal, merged,
+            )
+            break
+        i = index.get(prop.id)
+        if i is not None:
+            properties[i] = prop
+            merged += 1
+    return merged
+
+
+def _enrich_parallel(
+    scraper: BaseScraper,
+    properties: list[Property],
+    pending_idx: list[int],
+    input_file: Path,
+    workers: int,
+) -> tuple[int, int]:
+    """Enrich pending properties concurrently. Returns (n_enriched, n_failed).
+
+    Each worker still sleeps its own random request delay inside
+    enrich_property, so the per-worker request rate stays polite.
+    """
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+
+    n_enriched = n_failed = n_done = 0
+    total = len(pending_idx)
+    journal = _journal_path(input_file)
+
+    with ThreadPoolExecutor(max_workers=workers) as pool, open(journal, "ab") as jf:
+        futures = {
+            pool.submit(scraper.enrich_property, properties[i]): i
+            for i in pending_idx
+        }
+        try:
+            for future in as_completed(futures):
+                i = futures[future]
+                try:
+                    result = future.result()
+                except Exception as exc:
+                    typer.echo(f"\nStopped: {exc}", err=True)
+                    for f in futures:
+                        f.cancel()
+                    break
+
+                properties[i] = result
+                n_done += 1
+
+                if result.enriched:
+                    n_enriched += 1
+                    jf.write(_to_json_line(result) + b"\n")
+                    jf.flush()
+                    typer.echo(f"[{n_done}/{total}] Enriched {result.source_id}")
+                else:
+                    n_failed += 1
+                    typer.echo(f"[{n_done}/{total}] Failed   {result.source_id}", err=True)
+        finally:
+            _save_jsonl(input_file, properties)
+    journal.unlink(missing_ok=True)
+
+    return n_enriched, n_failed
 
 
 @app.command()
 def enrich(
     input_file: Path = typer.Argument(..., help="JSONL file to enrich in place"),
     batch_size: int = typer.Option(0, "--batch-size", "-b", help="Stop after enriching N properties (0 = no limit)"),
+    workers: int = typer.Option(1, "--workers", "-w", help="Concurrent fetches (scrapers with a thread-safe client only)"),
     verbose: bool = typer.Option(False, "--verbose", "-v", help="Show debug logs"),
 ) -> None:
     """Fetch detail pages for unenriched properties, updating the file in place.
 
-    Each successfully enriched property is written back immediately, so the
-    command is safely resumable — just re-run it on the same file.
+    Each enriched property is appended to a sidecar journal as soon as it
+    finishes, so the command is safely resumable — just re-run it on the
+    same file and any interrupted progress is recovered.
     """
     _setup_logging(verbose)
 
@@ -192,17 +313,16 @@ def enrich(
         typer.echo(f"File not found: {input_file}")
         raise typer.Exit(1)
 
-    properties: list[Property] = []
-    with open(input_file, "r", encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if line:
-                properties.append(Property.model_validate_json(line))
+    properties = _load_jsonl(input_file)
 
     if not properties:
         typer.echo("No properties in file.")
         raise typer.Exit(0)
 
+    recovered = _apply_journal(input_file, properties)
+    if recovered:
+        typer.echo(f"Recovered {recovered} enriched properties from an interrupted run.")
+
     source = properties[0].source
     scraper_instance = _get_scraper(source)
 
@@ -213,37 +333,58 @@ def enrich(
     pending = sum(1 for p in properties if not p.enriched)
     typer.echo(f"Loaded {len(properties)} properties ({pending} to enrich).")
 
-    total = len(properties)
+    if workers > 1 and not scraper_instance.SUPPORTS_PARALLEL_ENRICH:
+        typer.echo(f"Scraper '{source}' does not support parallel enrichment — using 1 worker.")
+        workers = 1
+
     n_enriched = n_skipped = n_failed = 0
 
-    with scraper_instance as scraper:
-        for i, prop in enumerate(properties):
-            if prop.enriched:
-                n_skipped += 1
-                continue
-
-            try:
-                result = scraper.enrich_property(prop)
-            except Exception as exc:
-                # UserStop or any other unexpected error — file is already up to date
-                typer.echo(f"\nStopped: {exc}", err=True)
-                break
-
-            properties[i] = result
-
-            if result.enriched:
-                n_enriched += 1
-                typer.echo(f"[{n_enriched + n_failed}/{pending}] Enriched {prop.source_id}")
-            else:
-                n_failed += 1
-                typer.echo(f"[{n_enriched + n_failed}/{pending}] Failed   {prop.source_id}", err=True)
-
-            # Save progress after every property so the file is always resumable
+    if workers > 1:
+        pending_idx = [i for i, p in enumerate(properties) if not p.enriched]
+        n_skipped = len(properties) - len(pending_idx)
+        if batch_size:
+            # In parallel mode the batch limit caps attempts, not successes
+            pending_idx = pending_idx[:batch_size]
+        with scraper_instance as scraper:
+            n_enriched, n_failed = _enrich_parallel(
+                scraper, properties, pending_idx, input_file, workers
+            )
+        typer.echo(f"Done: {n_enriched} enriched, {n_skipped} already done, {n_failed} failed")
+        return
+
+    with scraper_instance as scraper, open(_journal_path(input_file), "ab") as jf:
+        try:
+            for i, prop in enumerate(properties):
+                if prop.enriched:
+                    n_skipped += 1
+                    continue
+
+                try:
+                    result = scraper.enrich_property(prop)
+                except Exception as exc:
+                    # UserStop or any other unexpected error — the finally
+                    # block below saves whatever was enriched so far
+                    typer.echo(f"\nStopped: {exc}", err=True)
+                    break
+
+                properties[i] = result
+
+                if result.enriched:
+                    n_enriched += 1
+                    jf.write(_to_json_line(result) + b"\n")
+                    jf.flush()
+                    typer.echo(f"[{n_enriched + n_failed}/{pending}] Enriched {prop.source_id}")
+                else:
+                    n_failed += 1
+                    typer.echo(f"[{n_enriched + n_failed}/{pending}] Failed   {prop.source_id}", err=True)
+
+                if batch_size and n_enriched >= batch_size:
+                    typer.echo(f"Batch of {batch_size} complete — re-run to continue.")
+                    break
+        finally:
+            # Always leave the file up to date, whatever ended the loop
             _save_jsonl(input_file, properties)
-
-            if batch_size and n_enriched >= batch_size:
-                typer.echo(f"Batch of {batch_size} complete — re-run to continue.")
-                return
+    _journal_path(input_file).unlink(missing_ok=True)
 
     typer.echo(f"Done: {n_enriched} enriched, {n_skipped} already done, {n_failed} failed")
 
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 
 from supabase import create_client, Client
 from tenacity import retry, stop_after_attempt, wait_exponential
@@ -10,11 +11,32 @@ from src.models import Property
 
 logger = logging.getLogger(__name__)
 
+# Rows per upsert request — PostgREST handles large bodies fine, and fewer
+# roundtrips beats smaller payloads here. Multi-batch uploads run in parallel.
+BATCH_SIZE = 500
+UPSERT_WORKERS = 4
+
+# Model fields not present in the properties table (translations go to their
+# own table; enriched is scraper-side bookkeeping). Excluded at serialization
+# time so pydantic-core skips them instead of a Python pop pass per row.
+PROPERTIES_EXCLUDE = {"translations", "enriched"}
+
+
+_client: Client | None = None
+
 
 def get_client() -> Client:
-    if not settings.SUPABASE_URL or not settings.SUPABASE_KEY:
-        raise RuntimeError("SUPABASE_URL and SUPABASE_KEY must be set in .env")
-    return create_client(settings.SUPABASE_URL, settings.SUPABASE_KEY)
+    """Return a process-wide Supabase client, created on first use.
+
+    Creating a client builds a fresh connection pool and re-does the TLS
+    handshake, so retries and the per-batch upsert loops reuse one instance.
+    """
+    global _client
+    if _client is None:
+        if not settings.SUPABASE_URL or not settings.SUPABASE_KEY:
+            raise RuntimeError("SUPABASE_URL and SUPABASE_KEY must be set in .env")
+        _client = create_client(settings.SUPABASE_URL, settings.SUPABASE_KEY)
+    return _client
 
 
 @retry(
@@ -39,25 +61,22 @@ def upsert_properties(properties: list[Property]) -> int:
 
     client = get_client()
 
-    rows = [p.model_dump(mode="json") for p in valid]
-
-    # Remove fields managed by DB defaults or not in properties table
-    for row in rows:
-        for key in ("views_count", "saves_count", "created_at", "updated_at", "translations", "enriched"):
-            row.pop(key, None)
+    rows = [p.model_dump(mode="json", exclude=PROPERTIES_EXCLUDE) for p in valid]
 
-    BATCH_SIZE = 50
-    total = 0
-    for i in range(0, len(rows), BATCH_SIZE):
-        batch = rows[i : i + BATCH_SIZE]
+    def _upsert_batch(batch: list[dict]) -> int:
         result = (
             client.table("properties")
             .upsert(batch, on_conflict="source,source_id")
             .execute()
         )
-        total += len(result.data) if result.data else 0
+        return len(result.data) if result.data else 0
 
-    return total
+    batches = [rows[i : i + BATCH_SIZE] for i in range(0, len(rows), BATCH_SIZE)]
+    if len(batches) == 1:
+        return _upsert_batch(batches[0])
+
+    with ThreadPoolExecutor(max_workers=UPSERT_WORKERS) as pool:
+        return sum(pool.map(_upsert_batch, batches))
 
 
 @retry(
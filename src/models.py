@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from typing import Literal
 
-from pydantic import BaseModel, model_validator
+from pydantic import BaseModel, Field, model_validator
 
 
 class Translation(BaseModel):
@@ -30,17 +30,28 @@ class Property(BaseModel):
     postal_code: str | None = None
     latitude: float | None = None
     longitude: float | None = None
-    images: list[str] = []
-    specs: dict = {}
-    features: list[str] = []
+    # Container fields use default_factory so pydantic builds a fresh empty
+    # container instead of deep-copying a shared default on every instance.
+    # specs stays an untyped dict on purpose: keys vary per portal and an
+    # item type would buy per-value validation work, not safety.
+    images: list[str] = Field(default_factory=list)
+    specs: dict = Field(default_factory=dict)
+    features: list[str] = Field(default_factory=list)
     source: str = "idealista"
     source_id: str
     source_url: str | None = None
     enriched: bool = False
-    translations: list[Translation] = []
+    translations: list[Translation] = Field(default_factory=list)
 
     @model_validator(mode="after")
     def set_id(self) -> Property:
         if not self.id:
             self.id = f"{self.source}-{self.source_id}"
         return self
+
+    def translation(self, locale: str) -> Translation | None:
+        """Return the translation for `locale`, or None if absent."""
+        for t in self.translations:
+            if t.locale == locale:
+                return t
+        return None
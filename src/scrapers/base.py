@@ -24,6 +24,17 @@ class BaseScraper(ABC):
         "Accept-Language": "es-ES,es;q=0.9,en;q=0.8",
     }
 
+    # Whether enrich_property() may be called from multiple threads at once.
+    # Only safe for scrapers that fetch with a thread-safe HTTP client —
+    # a shared Playwright page must stay single-threaded.
+    SUPPORTS_PARALLEL_ENRICH = False
+
+    # Set to a name (e.g. "habitaclia") to launch the browser with a
+    # persistent profile under ~/.cache/mirascrape/<name>. Cookies, the HTTP
+    # cache, and anti-bot trust tokens then survive across CLI invocations,
+    # which cuts warmup time for repeated runs.
+    PROFILE_NAME: str | None = None
+
     def __init__(self) -> None:
         self._pw = None
         self._browser = None
@@ -31,17 +42,39 @@ class BaseScraper(ABC):
         self._page = None
         self._stop_requested: bool = False
         self._original_sigint = None
+        # Read the delay bounds once — settings lookups go through pydantic
+        # attribute machinery, which is wasted work on every request
+        self._delay_min: float = settings.REQUEST_DELAY_MIN
+        self._delay_span: float = settings.REQUEST_DELAY_MAX - self._delay_min
+        self._last_delay_ts: float = 0.0
 
     def _launch_browser(self) -> None:
         from patchright.sync_api import sync_playwright
 
-        logger.info("Launching browser")
         self._pw = sync_playwright().start()
-        self._browser = self._pw.chromium.launch(headless=False)
-        self._context = self._browser.new_context(
-            locale="es-ES",
-            extra_http_headers=self.HEADERS,
-        )
+        if self.PROFILE_NAME:
+            from pathlib import Path
+
+            profile_dir = Path.home() / ".cache" / "mirascrape" / self.PROFILE_NAME
+            profile_dir.mkdir(parents=True, exist_ok=True)
+            logger.info("Launching browser with persistent profile: %s", profile_dir)
+            self._context = self._pw.chromium.launch_persistent_context(
+                user_data_dir=str(profile_dir),
+                headless=False,
+                locale="es-ES",
+                viewport={"width": 1366, "height": 768},
+                extra_http_headers=self.HEADERS,
+            )
+            # launch_persistent_context returns a BrowserContext directly;
+            # there is no separate browser object to close
+            self._browser = None
+        else:
+            logger.info("Launching browser")
+            self._browser = self._pw.chromium.launch(headless=False)
+            self._context = self._browser.new_context(
+                locale="es-ES",
+                extra_http_headers=self.HEADERS,
+            )
         self._page = self._context.new_page()
 
     def _ensure_browser(self) -> None:
@@ -67,9 +100,18 @@ class BaseScraper(ABC):
         self.close()
 
     def _delay_sync(self) -> None:
-        delay = random.uniform(settings.REQUEST_DELAY_MIN, settings.REQUEST_DELAY_MAX)
-        logger.debug("Sleeping %.1fs between requests", delay)
-        time.sleep(delay)
+        """Sleep out the remainder of the politeness window.
+
+        Time already spent since the previous call (parsing, building models)
+        counts toward the window, so the sleep often collapses to zero.
+        """
+        delay = self._delay_min + self._delay_span * random.random()
+        now = time.monotonic()
+        remaining = delay - (now - self._last_delay_ts)
+        if remaining > 0:
+            logger.debug("Sleeping %.1fs between requests", remaining)
+            time.sleep(remaining)
+        self._last_delay_ts = time.monotonic()
 
     def _install_sigint_handler(self) -> None:
         import signal
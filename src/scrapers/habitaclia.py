@@ -21,6 +21,24 @@ BASE_URL = "https://www.habitaclia.com"
 # Progressive waits on 403: 1 min, 3 min, 5 min, 10 min
 _RATE_LIMIT_WAITS = [60, 180, 300, 600]
 
+# Compiled once at import — these run per listing/page in the hot parse paths
+_RE_IMG_SUFFIX = re.compile(r"(?:G|P|XL)?\.jpg$")
+_RE_URL_SUBTYPE = re.compile(r"/(?:alquiler|venta(?:-\w+)?)-([^-/]+)-")
+_RE_PRICE_JUNK = re.compile(r"[€\s]")
+_RE_PRICE_PERIOD = re.compile(r"/\w+")
+_RE_PAGE_NUM = re.compile(r"-(\d+)\.htm$")
+_RE_BATHROOMS = re.compile(r"(\d+)\s*ba[ñn]", re.IGNORECASE)
+_RE_GPS = re.compile(
+    r'\\"VGPSLat\\"\s*:\s*([\d.]+).*?\\"VGPSLon\\"\s*:\s*(-?[\d.]+)', re.DOTALL
+)
+_RE_WIDE_MEDIA = re.compile(
+    r'var\s+WideMediaDTO\b.*?\bimage\s*:\s*JSON\.parse\("((?:[^"\\]|\\.)*)"\)',
+    re.DOTALL,
+)
+_RE_PAGE_VIEWED = re.compile(
+    r'pageViewedEventData\s*:\s*JSON\.parse\("((?:[^"\\]|\\.)*)"\)'
+)
+
 
 class UserStop(Exception):
     """Raised when the user requests a graceful stop during rate-limit recovery."""
@@ -95,7 +113,7 @@ def _normalise_image_url(url: str) -> str:
     """
     if url.startswith("//"):
         url = "https:" + url
-    url = re.sub(r"(?:G|P|XL)?\.jpg$", "XL.jpg", url)
+    url = _RE_IMG_SUFFIX.sub("XL.jpg", url)
     return url
 
 
@@ -104,7 +122,7 @@ def _subtype_from_url(url: str) -> str | None:
 
     Example: /alquiler-piso-el_carme-valencia-i123.htm → 'apartment'
     """
-    m = re.search(r"/(?:alquiler|venta(?:-\w+)?)-([^-/]+)-", url)
+    m = _RE_URL_SUBTYPE.search(url)
     if m:
         return _URL_SUBTYPE_MAP.get(m.group(1).lower())
     return None
@@ -125,26 +143,8 @@ class HabitacliaScraper(BaseScraper):
     coordinates, the full image gallery, description, and features.
     """
 
-    def _launch_browser(self) -> None:
-        """Launch a persistent browser profile so Imperva trust tokens survive across runs."""
-        from pathlib import Path
-        from patchright.sync_api import sync_playwright
-
-        profile_dir = Path.home() / ".cache" / "mirascrape" / "habitaclia"
-        profile_dir.mkdir(parents=True, exist_ok=True)
-        logger.info("Launching browser with persistent profile: %s", profile_dir)
-
-        self._pw = sync_playwright().start()
-        self._context = self._pw.chromium.launch_persistent_context(
-            user_data_dir=str(profile_dir),
-            headless=False,
-            locale="es-ES",
-            viewport={"width": 1366, "height": 768},
-            extra_http_headers=self.HEADERS,
-        )
-        # launch_persistent_context returns a BrowserContext directly; no separate browser object
-        self._browser = None
-        self._page = self._context.new_page()
+    # Persistent profile so Imperva trust tokens survive across runs
+    PROFILE_NAME = "habitaclia"
 
     def _accept_cookies(self) -> None:
         """Click the cookie consent accept button if visible."""
@@ -354,8 +354,8 @@ class HabitacliaScraper(BaseScraper):
         """
         if not text:
             return None
-        cleaned = re.sub(r"[€\s]", "", text)
-        cleaned = re.sub(r"/\w+", "", cleaned)  # strip /mes, /m², etc.
+        cleaned = _RE_PRICE_JUNK.sub("", text)
+        cleaned = _RE_PRICE_PERIOD.sub("", cleaned)  # strip /mes, /m², etc.
         if not cleaned:
             return None
         if "," in cleaned:
@@ -378,7 +378,7 @@ class HabitacliaScraper(BaseScraper):
         for a in tree.css("div.pagination ul li a"):
             href = a.attributes.get("href", "")
             # Pages 2+ use a numeric suffix: alquiler-valencia-1.htm = page 2
-            m = re.search(r"-(\d+)\.htm$", href)
+            m = _RE_PAGE_NUM.search(href)
             if m:
                 last = max(last, int(m.group(1)) + 1)
         return last
@@ -458,7 +458,7 @@ class HabitacliaScraper(BaseScraper):
             feat_el = article.css_first("p.list-item-feature")
             if feat_el:
                 feat_text = feat_el.text(strip=True)
-                m = re.search(r"(\d+)\s*ba[ñn]", feat_text, re.IGNORECASE)
+                m = _RE_BATHROOMS.search(feat_text)
                 if m:
                     data["bathrooms"] = int(m.group(1))
 
@@ -533,10 +533,7 @@ class HabitacliaScraper(BaseScraper):
 
         # ── Coordinates from embedded GMapsConfig JSON ────────────────
         # Pattern inside a JSON.parse("...") string: "VGPSLat":39.48,"VGPSLon":-0.38
-        m = re.search(
-            r'\\"VGPSLat\\"\s*:\s*([\d.]+).*?\\"VGPSLon\\"\s*:\s*(-?[\d.]+)',
-            html, re.DOTALL,
-        )
+        m = _RE_GPS.search(html)
         if m:
             try:
                 data["latitude"] = float(m.group(1))
@@ -548,10 +545,7 @@ class HabitacliaScraper(BaseScraper):
         # The value is a JS string (outer double-quotes, inner \"-escaped),
         # so we use json.loads twice: first to decode the JS string escapes,
         # then to parse the resulting JSON array.
-        img_m = re.search(
-            r'var\s+WideMediaDTO\b.*?\bimage\s*:\s*JSON\.parse\("((?:[^"\\]|\\.)*)"\)',
-            html, re.DOTALL,
-        )
+        img_m = _RE_WIDE_MEDIA.search(html)
         if img_m:
             try:
                 img_json_str = json.loads('"' + img_m.group(1) + '"')
@@ -632,10 +626,7 @@ class HabitacliaScraper(BaseScraper):
             data["features"] = features
 
         # ── Neighbourhood / postal code from pageViewedEventData JSON ─
-        pved_m = re.search(
-            r'pageViewedEventData\s*:\s*JSON\.parse\("((?:[^"\\]|\\.)*)"\)',
-            html,
-        )
+        pved_m = _RE_PAGE_VIEWED.search(html)
         if pved_m:
             try:
                 pved_str = json.loads('"' + pved_m.group(1) + '"')
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
-import json
 import logging
 import re
+from functools import lru_cache
 
+from pydantic_core import from_json
 from selectolax.parser import HTMLParser
 from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception
 
@@ -13,6 +14,98 @@ from src.scrapers.base import BaseScraper, FetchError
 
 logger = logging.getLogger(__name__)
 
+# Compiled once at import — detail pages run half a dozen of these each, and
+# the interpreter's keyed pattern cache is too small to rely on
+_RE_POSTAL_CODE = re.compile(r"\b(\d{5})\b")
+# One alternation resolves "2 hab." vs "97 m²" in a single match attempt;
+# m.lastgroup says which branch hit
+_RE_FEATURE = re.compile(r"(?:(?P<rooms>\d+)\s*hab\.|(?P<area>\d+)\s*m²)")
+_RE_PRICE_JUNK = re.compile(r"[^\d.,]")
+# Both coordinates in one scan — pages emit them adjacently in JSON config
+_RE_COORDS = re.compile(
+    r'"latitude"\s*:\s*(?P<lat>[\d.]+).*?"longitude"\s*:\s*(?P<lon>[\d.-]+)',
+    re.DOTALL,
+)
+_RE_INMUEBLE_ID = re.compile(r"/inmueble/(\d+)/")
+_RE_DATA_ADID = re.compile(r'data-adid="(\d+)"')
+_RE_PAGINATION_BLOCK = re.compile(r'class="pagination-list".*?</ul>', re.DOTALL)
+_RE_PAGE_NUM = re.compile(r">\s*(\d+)\s*<")
+# Title keywords per sub-category — one C-level alternation scan per category
+# instead of a chain of Python substring tests
+_SUB_CATEGORY_PATTERNS = (
+    (re.compile(r"piso|apartamento|ático|atico|estudio|dúplex|duplex"), "apartment"),
+    (re.compile(r"casa|chalet|villa|adosado|pareado|finca"), "house"),
+    (re.compile(r"local|oficina|nave|comercial"), "commerce"),
+    (re.compile(r"terreno|parcela|solar"), "plot"),
+)
+
+
+@lru_cache(maxsize=2048)
+def _sub_category_from_title(title_lower: str) -> str | None:
+    """Classify a lowercased listing title; cached because the same title is
+    classified again when a listing is re-titled during enrichment."""
+    for pattern, category in _SUB_CATEGORY_PATTERNS:
+        if pattern.search(title_lower):
+            return category
+    return None
+
+
+@lru_cache(maxsize=64)
+def _js_var_pattern(var_name: str) -> re.Pattern[str]:
+    """Compiled assignment prefix ("name = ") for one JS variable name.
+
+    The pattern is built from the variable name, so it can't be a plain
+    module constant; the cache keeps one compile per name per process.
+    It is matched at occurrences located with str.find, so it doesn't
+    need to scan the document itself.
+    """
+    return re.compile(rf"{re.escape(var_name)}\s*=\s*")
+
+
+def _scan_js_literal(html: str, start: int) -> str | None:
+    """Return the balanced {...} or [...] literal beginning at html[start].
+
+    Tracks string and comment state, so semicolons or stray braces inside
+    the literal don't truncate the match — the old regex capture aborted
+    at the first ';' anywhere in the object.
+    """
+    open_ch = html[start]
+    close_ch = "}" if open_ch == "{" else "]"
+    n = len(html)
+    depth = 0
+    i = start
+    while i < n:
+        c = html[i]
+        if c == '"' or c == "'":
+            quote = c
+            i += 1
+            while i < n:
+                if html[i] == "\\":
+                    i += 2
+                    continue
+                if html[i] == quote:
+                    break
+                i += 1
+        elif c == "/" and i + 1 < n:
+            nxt = html[i + 1]
+            if nxt == "/":
+                i += 2
+                while i < n and html[i] != "\n":
+                    i += 1
+            elif nxt == "*":
+                i += 2
+                while i + 1 < n and not (html[i] == "*" and html[i + 1] == "/"):
+                    i += 1
+                i += 1
+        elif c == open_ch:
+            depth += 1
+        elif c == close_ch:
+            depth -= 1
+            if depth == 0:
+                return html[start : i + 1]
+        i += 1
+    return None
+
 
 def _is_retryable(exc: BaseException) -> bool:
     if isinstance(exc, FetchError):
@@ -23,6 +116,10 @@ def _is_retryable(exc: BaseException) -> bool:
 class IdealistaScraper(BaseScraper):
     BASE_URL = "https://www.idealista.com"
 
+    # Persistent profile so DataDome cookies survive across runs and the
+    # session warmup converges faster on repeat invocations
+    PROFILE_NAME = "idealista"
+
     # AJAX endpoints for listing discovery
     AJAX_URL_TEMPLATES = {
         "sale": "{base}/es/ajax/listing/georeach/venta-viviendas/valencia-valencia",
@@ -36,7 +133,21 @@ class IdealistaScraper(BaseScraper):
         "rent": "{base}/alquiler-viviendas/valencia-valencia/pagina-{page}.htm",
     }
 
-    DETAIL_URL_TEMPLATE = "{base}/inmueble/{ad_id}/"
+    def __init__(self) -> None:
+        super().__init__()
+        # str.format inside the per-listing loops adds up; precompute the
+        # fixed URL parts once and build with plain concatenation
+        self._detail_url_prefix = f"{self.BASE_URL}/inmueble/"
+        self._list_url_parts = {}
+        for lt, template in self.LIST_URL_TEMPLATES.items():
+            prefix, _, suffix = template.replace("{base}", self.BASE_URL).partition("{page}")
+            self._list_url_parts[lt] = (prefix, suffix)
+        # Set after the first session warmup so repeat scrape() calls in the
+        # same process skip the ~5s warmup navigation
+        self._warmed = False
+
+    def _detail_url(self, ad_id: str) -> str:
+        return self._detail_url_prefix + ad_id + "/"
 
     # ── JS extraction helpers ──────────────────────────────────────────
 
@@ -47,50 +158,131 @@ class IdealistaScraper(BaseScraper):
         Handles patterns like:
             var myVar = { ... };
             myVar = { ... };
-        """
-        # Try: var varName = { ... }; (greedy to capture nested braces)
-        pattern = rf"(?:var\s+)?{re.escape(var_name)}\s*=\s*(\{{[^;]*\}});?"
-        match = re.search(pattern, html, re.DOTALL)
-        if match:
-            return match.group(1)
-
-        # Try array form: var varName = [ ... ];
-        pattern = rf"(?:var\s+)?{re.escape(var_name)}\s*=\s*(\[[^;]*\]);?"
-        match = re.search(pattern, html, re.DOTALL)
-        if match:
-            return match.group(1)
 
+        Occurrences of the name are located with str.find — a C-level
+        substring scan — and the assignment pattern is only matched at
+        those positions, so the regex engine never walks the full
+        ~300 KB document per variable.
+        """
+        pattern = _js_var_pattern(var_name)
+        idx = html.find(var_name)
+        while idx != -1:
+            match = pattern.match(html, idx)
+            if match and match.end() < len(html) and html[match.end()] in "{[":
+                literal = _scan_js_literal(html, match.end())
+                if literal is not None:
+                    return literal
+            idx = html.find(var_name, idx + len(var_name))
         return None
 
     @staticmethod
     def _js_to_json(js_str: str) -> str:
-        """Convert a JS object literal to valid JSON.
+        """Convert a JS object literal to valid JSON in a single pass.
 
-        Handles: unquoted keys, single quotes, trailing commas, undefined/null.
+        Handles: unquoted keys, single quotes, comments, trailing commas,
+        and undefined/null. String contents are left untouched, so an
+        apostrophe inside a double-quoted string no longer breaks parsing
+        (the old global quote replacement did).
         """
         s = js_str
+        n = len(s)
+        out: list[str] = []
+        i = 0
+        while i < n:
+            c = s[i]
+
+            # Comments (only outside strings — strings are consumed below)
+            if c == "/" and i + 1 < n:
+                nxt = s[i + 1]
+                if nxt == "/":
+                    i += 2
+                    while i < n and s[i] != "\n":
+                        i += 1
+                    continue
+                if nxt == "*":
+                    i += 2
+                    while i + 1 < n and not (s[i] == "*" and s[i + 1] == "/"):
+                        i += 1
+                    i += 2
+                    continue
+
+            # Strings: copy verbatim, converting single-quoted to double-quoted
+            if c == '"' or c == "'":
+                quote = c
+                buf = ['"']
+                j = i + 1
+                while j < n:
+                    ch = s[j]
+                    if ch == "\\" and j + 1 < n:
+                        if s[j + 1] == "'":
+                            # \' is not a valid JSON escape — once the string
+                            # is double-quoted the apostrophe needs no escape
+                            buf.append("'")
+                        else:
+                            buf.append(s[j : j + 2])
+                        j += 2
+                        continue
+                    if ch == quote:
+                        break
+                    if ch == '"':
+                        # bare double quote inside a single-quoted string
+                        buf.append('\\"')
+                    else:
+                        buf.append(ch)
+                    j += 1
+                buf.append('"')
+                out.append("".join(buf))
+                i = j + 1
+                continue
 
-        # Replace single quotes with double quotes (but not inside already-double-quoted strings)
-        s = s.replace("'", '"')
-
-        # Remove JS comments
-        s = re.sub(r"//.*?$", "", s, flags=re.MULTILINE)
-        s = re.sub(r"/\*.*?\*/", "", s, flags=re.DOTALL)
-
-        # Replace undefined with null
-        s = re.sub(r"\bundefined\b", "null", s)
-
-        # Quote unquoted keys: { key: ... } -> { "key": ... }
-        s = re.sub(
-            r'(?<=[{,])\s*([a-zA-Z_$][a-zA-Z0-9_$]*)\s*:',
-            r' "\1":',
-            s,
-        )
-
-        # Remove trailing commas before } or ]
-        s = re.sub(r",\s*([}\]])", r"\1", s)
+            # Identifiers: quote keys (identifier followed by ':'),
+            # rewrite undefined, pass true/false/null/numbers through
+            if c.isalpha() or c == "_" or c == "$":
+                j = i + 1
+                while j < n and (s[j].isalnum() or s[j] == "_" or s[j] == "$"):
+                    j += 1
+                word = s[i:j]
+                k = j
+                while k < n and s[k] in " \t\r\n":
+                    k += 1
+                if k < n and s[k] == ":":
+                    out.append(f'"{word}"')
+                elif word == "undefined":
+                    out.append("null")
+                else:
+                    out.append(word)
+                i = j
+                continue
 
-        return s
+            # Trailing comma: drop if the next non-space char closes a scope
+            if c == ",":
+                k = i + 1
+                while k < n and s[k] in " \t\r\n":
+                    k += 1
+                if k < n and (s[k] == "}" or s[k] == "]"):
+                    i += 1
+                    continue
+
+            out.append(c)
+            i += 1
+
+        return "".join(out)
+
+    @classmethod
+    def _safe_load(cls, raw: str | None) -> dict:
+        """Decode a JS object literal to a dict, returning {} on failure."""
+        if not raw:
+            return {}
+        # Much of what the site embeds is already strict JSON — try the
+        # direct parse first and only sanitize on failure
+        try:
+            data = from_json(raw)
+        except ValueError:
+            try:
+                data = from_json(cls._js_to_json(raw))
+            except (ValueError, TypeError):
+                return {}
+        return data if isinstance(data, dict) else {}
 
     # ── Feature / spec parsing ─────────────────────────────────────────
 
@@ -102,34 +294,37 @@ class IdealistaScraper(BaseScraper):
         """
         specs: dict[str, str] = {}
         for item in features_list:
-            labels = item.get("label") or item.get("labels") or []
-            if isinstance(labels, list):
-                for label_item in labels:
-                    text = label_item if isinstance(label_item, str) else str(label_item)
-                    text = text.strip()
-                    if not text:
-                        continue
-                    if ":" in text:
-                        k, v = text.split(":", 1)
-                        specs[k.strip()] = v.strip()
-                    else:
-                        specs[text] = "true"
-            elif isinstance(labels, str):
+            labels = item.get("label") or item.get("labels") or ()
+            if isinstance(labels, str):
+                # Rare degenerate shape: a bare string instead of a list
                 specs[labels.strip()] = "true"
+                continue
+            for label_item in labels:
+                text = label_item if isinstance(label_item, str) else str(label_item)
+                text = text.strip()
+                if not text:
+                    continue
+                # find + slice splits without building an intermediate list
+                idx = text.find(":")
+                if idx != -1:
+                    specs[text[:idx].strip()] = text[idx + 1 :].strip()
+                else:
+                    specs[text] = "true"
         return specs
 
     @staticmethod
-    def _parse_detail_features(html: str) -> tuple[dict[str, str], list[str]]:
-        """Parse .details-property_features HTML into specs dict + features list."""
-        tree = HTMLParser(html)
+    def _parse_detail_features(html: str | HTMLParser) -> tuple[dict[str, str], list[str]]:
+        """Parse .details-property_features HTML into specs dict + features list.
+
+        Accepts raw HTML or an already-parsed tree so parse_detail_page can
+        build the DOM once and share it across helpers.
+        """
+        tree = HTMLParser(html) if isinstance(html, str) else html
         specs: dict[str, str] = {}
         features: list[str] = []
 
-        container = tree.css_first(".details-property_features")
-        if not container:
-            return specs, features
-
-        for li in container.css("li"):
+        # One combined selector pass instead of css_first + a nested css()
+        for li in tree.css(".details-property_features li"):
             text = li.text(strip=True)
             if not text:
                 continue
@@ -142,9 +337,9 @@ class IdealistaScraper(BaseScraper):
         return specs, features
 
     @staticmethod
-    def _extract_location(html: str) -> dict[str, str | None]:
+    def _extract_location(html: str | HTMLParser) -> dict[str, str | None]:
         """Extract location info from .header-map-list elements."""
-        tree = HTMLParser(html)
+        tree = HTMLParser(html) if isinstance(html, str) else html
         loc: dict[str, str | None] = {
             "location": None,
             "province": None,
@@ -153,12 +348,11 @@ class IdealistaScraper(BaseScraper):
             "postal_code": None,
         }
 
-        header_map = tree.css_first("#headerMap")
-        if not header_map:
-            return loc
-
-        items = header_map.css("li")
-        texts = [li.text(strip=True) for li in items if li.text(strip=True)]
+        texts = []
+        for li in tree.css("#headerMap li"):
+            text = li.text(strip=True)
+            if text:
+                texts.append(text)
 
         if texts:
             loc["location"] = ", ".join(texts)
@@ -167,7 +361,7 @@ class IdealistaScraper(BaseScraper):
         # or [street, neighborhood, municipality, province]
         for text in texts:
             # Postal code pattern
-            pc_match = re.search(r"\b(\d{5})\b", text)
+            pc_match = _RE_POSTAL_CODE.search(text)
             if pc_match:
                 loc["postal_code"] = pc_match.group(1)
 
@@ -184,9 +378,9 @@ class IdealistaScraper(BaseScraper):
         return loc
 
     @staticmethod
-    def _extract_description(html: str) -> str | None:
+    def _extract_description(html: str | HTMLParser) -> str | None:
         """Extract description text from detail page."""
-        tree = HTMLParser(html)
+        tree = HTMLParser(html) if isinstance(html, str) else html
         comment = tree.css_first(".comment")
         if not comment:
             comment = tree.css_first("#details-content .adCommentsLanguage")
@@ -198,16 +392,7 @@ class IdealistaScraper(BaseScraper):
     @staticmethod
     def _guess_sub_category(title: str, specs: dict) -> str | None:
         """Guess sub_category from title and specs."""
-        title_lower = title.lower()
-        if any(w in title_lower for w in ("piso", "apartamento", "ático", "atico", "estudio", "dúplex", "duplex")):
-            return "apartment"
-        if any(w in title_lower for w in ("casa", "chalet", "villa", "adosado", "pareado", "finca")):
-            return "house"
-        if any(w in title_lower for w in ("local", "oficina", "nave", "comercial")):
-            return "commerce"
-        if any(w in title_lower for w in ("terreno", "parcela", "solar")):
-            return "plot"
-        return None
+        return _sub_category_from_title(title.lower())
 
     # ── AJAX response parsing ──────────────────────────────────────────
 
@@ -223,24 +408,22 @@ class IdealistaScraper(BaseScraper):
             if not feat:
                 continue
 
-            # Rooms: "2 hab." or "1 hab."
-            m = re.match(r"(\d+)\s*hab\.", feat)
+            # Rooms ("2 hab.") or area ("97 m²") in one match attempt
+            m = _RE_FEATURE.match(feat)
             if m:
-                specs["habitaciones"] = m.group(1)
-                continue
-
-            # Area: "97 m²"
-            m = re.match(r"(\d+)\s*m²", feat)
-            if m:
-                specs["superficie"] = f"{m.group(1)} m²"
+                if m.lastgroup == "rooms":
+                    specs["habitaciones"] = m.group("rooms")
+                else:
+                    specs["superficie"] = f"{m.group('area')} m²"
                 continue
 
             # Floor + elevator: "Planta 2ª Con ascensor" / "Bajo ext. Sin ascensor"
-            if "planta" in feat.lower() or "bajo" in feat.lower():
+            feat_lower = feat.lower()
+            if "planta" in feat_lower or "bajo" in feat_lower:
                 specs["planta"] = feat
-                if "con ascensor" in feat.lower():
+                if "con ascensor" in feat_lower:
                     specs["ascensor"] = "true"
-                elif "sin ascensor" in feat.lower():
+                elif "sin ascensor" in feat_lower:
                     specs["ascensor"] = "false"
                 continue
 
@@ -271,7 +454,7 @@ class IdealistaScraper(BaseScraper):
         images = [thumbnail] if thumbnail else []
 
         # Source URL
-        source_url = f"{self.BASE_URL}{detail_url}" if detail_url else f"{self.BASE_URL}/inmueble/{ad_id}/"
+        source_url = f"{self.BASE_URL}{detail_url}" if detail_url else self._detail_url(ad_id)
 
         # Check if this is new-building from ribbons
         ribbons = ad.get("ribbons", [])
@@ -305,21 +488,23 @@ class IdealistaScraper(BaseScraper):
         """Parse a single Idealista detail page into a Property."""
         tree = HTMLParser(html)
 
+        # ── Decode each embedded JS object once, reused below ──
+        mortgages = self._safe_load(self._extract_js_var(html, "mortgagesConfig"))
+        ad_detail = self._safe_load(self._extract_js_var(html, "adDetail"))
+        multimedia = self._safe_load(self._extract_js_var(html, "adMultimediasInfo"))
+
         # ── Price from mortgagesConfig.initialPrice ──
         price: float | None = None
-        mortgages_raw = self._extract_js_var(html, "mortgagesConfig")
-        if mortgages_raw:
-            try:
-                mortgages = json.loads(self._js_to_json(mortgages_raw))
-                price = float(mortgages.get("initialPrice", 0)) or None
-            except (json.JSONDecodeError, ValueError, TypeError):
-                pass
+        try:
+            price = float(mortgages.get("initialPrice", 0)) or None
+        except (ValueError, TypeError):
+            pass
 
         # Fallback: try price from HTML
         if price is None:
             price_el = tree.css_first(".info-data-price .txt-bold")
             if price_el:
-                price_text = re.sub(r"[^\d.,]", "", price_el.text(strip=True))
+                price_text = _RE_PRICE_JUNK.sub("", price_el.text(strip=True))
                 price_text = price_text.replace(".", "").replace(",", ".")
                 try:
                     price = float(price_text)
@@ -327,14 +512,7 @@ class IdealistaScraper(BaseScraper):
                     pass
 
         # ── Title ──
-        title = ""
-        ad_detail_raw = self._extract_js_var(html, "adDetail")
-        if ad_detail_raw:
-            try:
-                ad_detail = json.loads(self._js_to_json(ad_detail_raw))
-                title = ad_detail.get("headerTitle", "")
-            except (json.JSONDecodeError, ValueError):
-                pass
+        title = ad_detail.get("headerTitle", "")
 
         if not title:
             h1 = tree.css_first("h1")
@@ -346,58 +524,40 @@ class IdealistaScraper(BaseScraper):
 
         # ── Images from adMultimediasInfo ──
         images: list[str] = []
-        multimedia_raw = self._extract_js_var(html, "adMultimediasInfo")
-        if multimedia_raw:
-            try:
-                multimedia = json.loads(self._js_to_json(multimedia_raw))
-                gallery = multimedia.get("fullScreenGalleryPics", [])
-                for pic in gallery:
-                    if pic.get("isPlan"):
-                        continue
-                    url = pic.get("src") or pic.get("url") or ""
-                    if url:
-                        images.append(url)
-                    if len(images) >= 10:
-                        break
-            except (json.JSONDecodeError, ValueError):
-                pass
+        for pic in multimedia.get("fullScreenGalleryPics", []):
+            if pic.get("isPlan"):
+                continue
+            url = pic.get("src") or pic.get("url") or ""
+            if url:
+                images.append(url)
+            if len(images) >= 10:
+                break
 
         # ── Specs from JS then HTML ──
         specs: dict[str, str] = {}
         features: list[str] = []
 
         # Try adMultimediasInfo.features first
-        if multimedia_raw:
-            try:
-                multimedia = json.loads(self._js_to_json(multimedia_raw))
-                js_features = multimedia.get("features", [])
-                if js_features:
-                    specs.update(self._parse_features(js_features))
-            except (json.JSONDecodeError, ValueError):
-                pass
+        js_features = multimedia.get("features", [])
+        if js_features:
+            specs.update(self._parse_features(js_features))
 
         # Try adDetail.headerFeatures
-        if ad_detail_raw:
-            try:
-                ad_detail = json.loads(self._js_to_json(ad_detail_raw))
-                header_features = ad_detail.get("headerFeatures", [])
-                if header_features:
-                    specs.update(self._parse_features(header_features))
-            except (json.JSONDecodeError, ValueError):
-                pass
-
-        # HTML features (supplements JS data)
-        html_specs, html_features = self._parse_detail_features(html)
-        for k, v in html_specs.items():
-            if k not in specs:
-                specs[k] = v
+        header_features = ad_detail.get("headerFeatures", [])
+        if header_features:
+            specs.update(self._parse_features(header_features))
+
+        # HTML features (supplements JS data) — reuse the tree parsed above;
+        # one C-level merge with the JS-derived specs winning on conflicts
+        html_specs, html_features = self._parse_detail_features(tree)
+        specs = {**html_specs, **specs}
         features.extend(html_features)
 
         # ── Location ──
-        loc = self._extract_location(html)
+        loc = self._extract_location(tree)
 
         # ── Description ──
-        description = self._extract_description(html)
+        description = self._extract_description(tree)
 
         # ── Coordinates from map ──
         latitude: float | None = None
@@ -412,21 +572,35 @@ class IdealistaScraper(BaseScraper):
             except ValueError:
                 pass
 
-        # Also try from JS
+        # Next: the JS configs decoded above often carry them directly
         if latitude is None:
-            lat_match = re.search(r'"latitude"\s*:\s*([\d.]+)', html)
-            lon_match = re.search(r'"longitude"\s*:\s*([\d.-]+)', html)
-            if lat_match and lon_match:
+            for config in (ad_detail, ad_detail.get("map"), multimedia):
+                if not isinstance(config, dict):
+                    continue
+                lat, lon = config.get("latitude"), config.get("longitude")
+                if lat is None or lon is None:
+                    continue
                 try:
-                    latitude = float(lat_match.group(1))
-                    longitude = float(lon_match.group(1))
+                    latitude = float(lat)
+                    longitude = float(lon)
+                except (ValueError, TypeError):
+                    continue
+                break
+
+        # Last resort: one combined regex scan over the raw HTML
+        if latitude is None:
+            coords = _RE_COORDS.search(html)
+            if coords:
+                try:
+                    latitude = float(coords.group("lat"))
+                    longitude = float(coords.group("lon"))
                 except ValueError:
                     pass
 
         # ── Sub-category ──
         sub_category = self._guess_sub_category(title, specs)
 
-        source_url = f"{self.BASE_URL}/inmueble/{ad_id}/"
+        source_url = self._detail_url(ad_id)
 
         return Property(
             listing_type=listing_type,
@@ -465,42 +639,31 @@ class IdealistaScraper(BaseScraper):
         utag_raw = self._extract_js_var(html, "utag_data")
         if utag_raw:
             try:
-                utag = json.loads(self._js_to_json(utag_raw))
+                utag = from_json(self._js_to_json(utag_raw))
                 # adIds can be a comma-separated string or list
                 ad_ids = utag.get("adIds", "")
                 if isinstance(ad_ids, str) and ad_ids:
                     ids = [x.strip() for x in ad_ids.split(",") if x.strip()]
                 elif isinstance(ad_ids, list):
                     ids = [str(x) for x in ad_ids]
-            except (json.JSONDecodeError, ValueError):
+            except (ValueError, AttributeError):
                 pass
 
-        # Fallback: parse article elements
+        # Fallback: scan the raw HTML for article ids — a pair of findall
+        # passes beats building and walking a lexbor tree for this
         if not ids:
-            tree = HTMLParser(html)
-            for article in tree.css("article.item"):
-                data_id = article.attributes.get("data-adid", "")
-                if not data_id:
-                    # Try extracting from the link
-                    link = article.css_first("a.item-link")
-                    if link:
-                        href = link.attributes.get("href", "")
-                        match = re.search(r"/inmueble/(\d+)/", href)
-                        if match:
-                            data_id = match.group(1)
-                if data_id:
-                    ids.append(data_id)
-
-        # Total pages from pagination
-        tree = HTMLParser(html)
-        pagination = tree.css(".pagination-list li a")
-        for link in pagination:
-            text = link.text(strip=True)
-            try:
-                page_num = int(text)
-                total_pages = max(total_pages, page_num)
-            except ValueError:
-                continue
+            ids = list(dict.fromkeys(_RE_DATA_ADID.findall(html)))
+        if not ids:
+            # Last resort: ids embedded in detail links
+            ids = list(dict.fromkeys(_RE_INMUEBLE_ID.findall(html)))
+
+        # Total pages: largest number inside the pagination block
+        block = _RE_PAGINATION_BLOCK.search(html)
+        if block:
+            total_pages = max(
+                (int(n) for n in _RE_PAGE_NUM.findall(block.group(0))),
+                default=1,
+            )
 
         return ids, total_pages
 
@@ -529,26 +692,24 @@ class IdealistaScraper(BaseScraper):
     )
     def _fetch_json(self, url: str, referer: str | None = None) -> dict:
         self._ensure_browser()
-        try:
-            result = self._page.evaluate(
-                """async ([url, referer]) => {
-                    const headers = {
-                        'X-Requested-With': 'XMLHttpRequest',
-                        'Accept': 'application/json, text/javascript, */*; q=0.01',
-                    };
-                    if (referer) headers['Referer'] = referer;
-                    const resp = await fetch(url, { headers });
-                    if (!resp.ok) throw new Error('HTTP_' + resp.status);
-                    return await resp.json();
-                }""",
-                [url, referer],
-            )
-        except Exception as e:
-            match = re.search(r"HTTP_(\d+)", str(e))
-            if match:
-                raise FetchError(int(match.group(1)), url) from e
-            raise
-        return result
+        # The page function reports failures structurally instead of
+        # throwing, so no string-parsing of JS error messages is needed
+        result = self._page.evaluate(
+            """async ([url, referer]) => {
+                const headers = {
+                    'X-Requested-With': 'XMLHttpRequest',
+                    'Accept': 'application/json, text/javascript, */*; q=0.01',
+                };
+                if (referer) headers['Referer'] = referer;
+                const resp = await fetch(url, { headers });
+                if (!resp.ok) return { ok: false, status: resp.status };
+                return { ok: true, body: await resp.json() };
+            }""",
+            [url, referer],
+        )
+        if not result.get("ok"):
+            raise FetchError(result.get("status", 0), url)
+        return result["body"]
 
     # ── Main scrape orchestration ──────────────────────────────────────
 
@@ -577,10 +738,12 @@ class IdealistaScraper(BaseScraper):
             f"{self.BASE_URL}/venta-viviendas/valencia-valencia/",
         )
         self._ensure_browser()
-        logger.info("Warming up browser session: %s", warmup_url)
-        self._page.goto(warmup_url, wait_until="networkidle")
-        self._page.wait_for_timeout(3000)
-        self._delay_sync()
+        if not self._warmed:
+            logger.info("Warming up browser session: %s", warmup_url)
+            self._page.goto(warmup_url, wait_until="networkidle")
+            self._page.wait_for_timeout(3000)
+            self._delay_sync()
+            self._warmed = True
 
         # ── Step 2: Fetch listings from AJAX endpoint ──
         ajax_template = self.AJAX_URL_TEMPLATES.get(listing_type)
@@ -639,9 +802,10 @@ class IdealistaScraper(BaseScraper):
         enrich: bool,
     ) -> list[Property]:
         """Fallback: scrape from HTML list pages + detail pages."""
-        url_template = self.LIST_URL_TEMPLATES.get(listing_type)
-        if not url_template:
+        url_parts = self._list_url_parts.get(listing_type)
+        if not url_parts:
             return []
+        url_prefix, url_suffix = url_parts
 
         all_ids: list[str] = []
         total_pages = 1
@@ -650,7 +814,7 @@ class IdealistaScraper(BaseScraper):
             if page > total_pages and page > 1:
                 break
 
-            url = url_template.format(base=self.BASE_URL, page=page)
+            url = url_prefix + str(page) + url_suffix
             logger.info("Fetching list page %d: %s", page, url)
 
             try:
@@ -669,13 +833,8 @@ class IdealistaScraper(BaseScraper):
             if page < max_pages:
                 self._delay_sync()
 
-        # Deduplicate while preserving order
-        seen: set[str] = set()
-        unique_ids: list[str] = []
-        for ad_id in all_ids:
-            if ad_id not in seen:
-                seen.add(ad_id)
-                unique_ids.append(ad_id)
+        # Deduplicate while preserving order (dicts keep insertion order)
+        unique_ids = list(dict.fromkeys(all_ids))
 
         if not unique_ids:
             return []
@@ -684,7 +843,7 @@ class IdealistaScraper(BaseScraper):
 
         properties: list[Property] = []
         for i, ad_id in enumerate(unique_ids, 1):
-            detail_url = self.DETAIL_URL_TEMPLATE.format(base=self.BASE_URL, ad_id=ad_id)
+            detail_url = self._detail_url(ad_id)
             logger.info("Detail (%d/%d): %s", i, len(unique_ids), detail_url)
 
             try:
@@ -711,9 +870,7 @@ class IdealistaScraper(BaseScraper):
         logger.info("Enriching %d properties from detail pages", len(properties))
 
         for i, prop in enumerate(properties, 1):
-            detail_url = self.DETAIL_URL_TEMPLATE.format(
-                base=self.BASE_URL, ad_id=prop.source_id
-            )
+            detail_url = self._detail_url(prop.source_id)
             logger.info("Enrich (%d/%d): %s", i, len(properties), detail_url)
 
             try:
@@ -739,12 +896,10 @@ class IdealistaScraper(BaseScraper):
                     prop.postal_code = detail_prop.postal_code
                 if len(detail_prop.images) > len(prop.images):
                     prop.images = detail_prop.images
-                # Merge specs (detail page may have more)
-                for k, v in detail_prop.specs.items():
-                    if k not in prop.specs:
-                        prop.specs[k] = v
-                # Use detail title if AJAX title was just an address
-                if detail_prop.title and detail_prop.title != f"Listing {prop.source_id}":
+                # Merge specs (detail page may have more); existing keys win
+                prop.specs = {**detail_prop.specs, **prop.specs}
+                # Use detail title unless it's the "Listing <id>" placeholder
+                if detail_prop.title and not detail_prop.title.startswith("Listing "):
                     prop.title = detail_prop.title
                     prop.sub_category = self._guess_sub_category(prop.title, prop.specs)
 
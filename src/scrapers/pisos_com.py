@@ -7,6 +7,7 @@ import json
 import logging
 import math
 import re
+import threading
 import time
 import unicodedata
 
@@ -22,6 +23,15 @@ logger = logging.getLogger(__name__)
 BASE_URL = "https://www.pisos.com"
 ITEMS_PER_PAGE = 30
 
+# Compiled once at import — these run per listing in the hot parse paths
+_RE_PRICE_PERIOD = re.compile(r"/\w+")
+_RE_BEDROOMS = re.compile(r"(\d+)\s*hab", re.IGNORECASE)
+_RE_BATHROOMS = re.compile(r"(\d+)\s*ba[ñn]", re.IGNORECASE)
+_RE_SIZE = re.compile(r"([\d.,]+)\s*m[²2]", re.IGNORECASE)
+_RE_IMG_FORMAT = re.compile(r"(https?://fotos\.imghs\.net)/[^/]+/")
+_RE_URL_TYPE = re.compile(r"/(?:comprar|alquiler)/([^-/]+)")
+_RE_TOTAL_COUNT = re.compile(r"de\s+([\d.]+)\s+resultados")
+
 
 # List-page type slug → sub_category
 TYPE_TO_SUB_CATEGORY: dict[str, str] = {
@@ -56,28 +66,37 @@ LOCATION_SLUG = "valencia"
 class PisosComScraper(BaseScraper):
     """Scraper for pisos.com using httpx + selectolax."""
 
+    SUPPORTS_PARALLEL_ENRICH = True  # httpx.Client is thread-safe
+
     def __init__(self) -> None:
         super().__init__()
         self._http: httpx.Client | None = None
+        self._http_lock = threading.Lock()
 
     def _ensure_http(self) -> httpx.Client:
+        # Double-checked: parallel enrich workers can race the first fetch
         if self._http is None:
-            self._http = httpx.Client(
-                headers={
-                    "User-Agent": (
-                        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                        "AppleWebKit/537.36 (KHTML, like Gecko) "
-                        "Chrome/131.0.0.0 Safari/537.36"
-                    ),
-                    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-                    "Accept-Language": "es-ES,es;q=0.9",
-                    "Accept-Encoding": "gzip, deflate, br",
-                },
-                follow_redirects=True,
-                timeout=30.0,
-            )
+            with self._http_lock:
+                if self._http is None:
+                    self._http = self._build_http()
         return self._http
 
+    def _build_http(self) -> httpx.Client:
+        return httpx.Client(
+            headers={
+                "User-Agent": (
+                    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+                    "AppleWebKit/537.36 (KHTML, like Gecko) "
+                    "Chrome/131.0.0.0 Safari/537.36"
+                ),
+                "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+                "Accept-Language": "es-ES,es;q=0.9",
+                "Accept-Encoding": "gzip, deflate, br",
+            },
+            follow_redirects=True,
+            timeout=30.0,
+        )
+
     def close(self) -> None:
         if self._http is not None:
             self._http.close()
@@ -136,7 +155,7 @@ class PisosComScraper(BaseScraper):
         if not text:
             return None
         cleaned = text.replace("€", "")
-        cleaned = re.sub(r"/\w+", "", cleaned)  # strip /mes, /sem, etc.
+        cleaned = _RE_PRICE_PERIOD.sub("", cleaned)  # strip /mes, /sem, etc.
         cleaned = cleaned.strip()
         if not cleaned:
             return None
@@ -164,15 +183,15 @@ class PisosComScraper(BaseScraper):
         specs: dict = {}
         for char in chars:
             c = char.strip()
-            m = re.match(r"(\d+)\s*hab", c, re.IGNORECASE)
+            m = _RE_BEDROOMS.match(c)
             if m:
                 specs["bedrooms"] = int(m.group(1))
                 continue
-            m = re.match(r"(\d+)\s*ba[ñn]", c, re.IGNORECASE)
+            m = _RE_BATHROOMS.match(c)
             if m:
                 specs["bathrooms"] = int(m.group(1))
                 continue
-            m = re.match(r"([\d.,]+)\s*m[²2]", c, re.IGNORECASE)
+            m = _RE_SIZE.match(c)
             if m:
                 size_str = m.group(1).replace(".", "").replace(",", ".")
                 try:
@@ -190,7 +209,7 @@ class PisosComScraper(BaseScraper):
         All pisos.com image formats share the same path after the format segment:
             fch-wp/1055/307/photo.jpg  →  h700-wp/1055/307/photo.jpg
         """
-        return re.sub(r"(https?://fotos\.imghs\.net)/[^/]+/", r"\1/h700-wp/", url)
+        return _RE_IMG_FORMAT.sub(r"\1/h700-wp/", url)
 
     # ── Sub-category ──────────────────────────────────────────────────
 
@@ -202,7 +221,7 @@ class PisosComScraper(BaseScraper):
             /comprar/piso-sueca-123/ → "apartment"
             /comprar/chalet-benidorm-456/ → "house"
         """
-        m = re.search(r"/(?:comprar|alquiler)/([^-/]+)", url)
+        m = _RE_URL_TYPE.search(url)
         if m:
             return _URL_TYPE_MAP.get(m.group(1))
         return None
@@ -231,7 +250,7 @@ class PisosComScraper(BaseScraper):
         """Extract total listing count from 'N de M resultados'."""
         tree = HTMLParser(html)
         for el in tree.css("span.pagination__counter"):
-            m = re.search(r"de\s+([\d.]+)\s+resultados", el.text())
+            m = _RE_TOTAL_COUNT.search(el.text())
             if m:
                 return int(m.group(1).replace(".", "").replace(",", ""))
         return 0
@@ -6,7 +6,10 @@ import json
 import logging
 import math
 import re
+import threading
 import time
+import unicodedata
+from functools import lru_cache
 from urllib.parse import urlencode
 
 import httpx
@@ -21,6 +24,9 @@ logger = logging.getLogger(__name__)
 
 BASE_URL = "https://spain-real.estate"
 
+# Static list-page path bases, resolved once instead of per build_list_url call
+_LIST_BASE = {"rent": f"{BASE_URL}/rent/", "sale": f"{BASE_URL}/property/"}
+
 # Tabs and their mapping to sub_category
 TAB_SUB_CATEGORY: dict[str, str | None] = {
     "apartment": "apartment",
@@ -31,59 +37,154 @@ TAB_SUB_CATEGORY: dict[str, str | None] = {
 
 ITEMS_PER_PAGE = 24
 
-# Province lookup for Valencian Community cities
+# Compiled once at import — these run per listing in the hot parse paths
+_RE_PRICE_PERIOD = re.compile(r"(?:monthly|yearly|weekly)", re.IGNORECASE)
+_RE_TITLE_LOCATION = re.compile(r"\bin\s+(.+?)(?:,\s*Spain|\s+No\.)", re.IGNORECASE)
+_RE_OUT_OF = re.compile(r"out of\s+([\d,]+)")
+_RE_COUNT = re.compile(r"([\d,]+)")
+# Page numbers inside the (tiny, well-formed) pagination <ul> slice
+_RE_PAGE_NUM = re.compile(r">\s*(\d+)\s*<")
+
+# raw_decode stops at the balanced closing brace, so OBJECT_MAP_DATA can be
+# pulled out with str.find instead of a DOTALL regex over the whole page
+_JSON_DECODER = json.JSONDecoder()
+
+# Deletes currency symbols and every whitespace variant in one C-level pass
+_PRICE_STRIP = str.maketrans("", "", " \t\n\xa0€")
+
+# Detail-page nodes gathered in one selector pass by _parse_detail_data
+_DETAIL_SELECTOR = (
+    'span.rent_period, #gallery_container .thumbs img, .features ul li, '
+    'link[rel="alternate"][hreflang]'
+)
+
+# Every list-item node parse_list_page cares about, fetched in one selector
+# pass per <li> and dispatched on tag + class
+_LIST_ITEM_SELECTOR = (
+    "div.title a, div.price, span.rent-period, span.rooms b, span.bedrooms b, "
+    "span.bathrooms b, span.area b, div.excerpt, img.thumb"
+)
+
+# Checked in order — apartment terms win over house terms when both appear,
+# matching the original tuple-of-substrings priority
+_SUB_CATEGORY_PATTERNS: list[tuple[re.Pattern[str], str]] = [
+    (re.compile(r"apartment|flat|penthouse|duplex|studio|townhouse"), "apartment"),
+    (re.compile(r"villa|house|chalet|bungalow|finca"), "house"),
+    (re.compile(r"commercial|office|shop|hotel|business|restaurant"), "commerce"),
+    (re.compile(r"land|plot"), "plot"),
+]
+
+
+def _norm_city(s: str) -> str:
+    """Accent-stripped casefold, so "Jávea" and "javea" share one key."""
+    s = unicodedata.normalize("NFD", s.casefold())
+    return "".join(c for c in s if unicodedata.category(c) != "Mn")
+
+
+# Province lookup for Valencian Community cities. Keys are normalised with
+# _norm_city at import, so accented and plain spellings need one entry each.
 CITY_TO_PROVINCE: dict[str, str] = {
-    "valencia": "Valencia",
-    "alicante": "Alicante",
-    "castellón": "Castellón",
-    "castellon": "Castellón",
-    "benidorm": "Alicante",
-    "torrevieja": "Alicante",
-    "calpe": "Alicante",
-    "denia": "Alicante",
-    "altea": "Alicante",
-    "orihuela": "Alicante",
-    "elche": "Alicante",
-    "gandia": "Valencia",
-    "sagunto": "Valencia",
-    "xàtiva": "Valencia",
-    "jávea": "Alicante",
-    "javea": "Alicante",
-    "villajoyosa": "Alicante",
-    "guardamar del segura": "Alicante",
-    "pilar de la horadada": "Alicante",
-    "benicàssim": "Castellón",
-    "peñíscola": "Castellón",
-    "vinaròs": "Castellón",
+    _norm_city(city): province
+    for city, province in {
+        "valencia": "Valencia",
+        "alicante": "Alicante",
+        "castellón": "Castellón",
+        "benidorm": "Alicante",
+        "torrevieja": "Alicante",
+        "calpe": "Alicante",
+        "denia": "Alicante",
+        "altea": "Alicante",
+        "orihuela": "Alicante",
+        "elche": "Alicante",
+        "gandia": "Valencia",
+        "sagunto": "Valencia",
+        "xàtiva": "Valencia",
+        "jávea": "Alicante",
+        "villajoyosa": "Alicante",
+        "guardamar del segura": "Alicante",
+        "pilar de la horadada": "Alicante",
+        "benicàssim": "Castellón",
+        "peñíscola": "Castellón",
+        "vinaròs": "Castellón",
+    }.items()
 }
 
 
+# Titles are heavily templated ("Apartment in Benidorm, Spain No. 12345"),
+# so both pure title helpers are memoized at module scope — a dict probe
+# replaces the lowercase/substring/regex work on repeats.
+@lru_cache(maxsize=4096)
+def _guess_sub_category(title: str) -> str | None:
+    t = title.lower()
+    for pattern, category in _SUB_CATEGORY_PATTERNS:
+        if pattern.search(t):
+            return category
+    return None
+
+
+@lru_cache(maxsize=4096)
+def _location_from_title(title: str) -> tuple[str | None, str | None]:
+    """Return (municipality, province) from 'Type in City, Spain' titles."""
+    m = _RE_TITLE_LOCATION.search(title)
+    if not m:
+        return None, None
+    # "Benidorm, Alicante" or just "Valencia"
+    parts = [p.strip() for p in m.group(1).split(",") if p.strip()]
+    if not parts:
+        return None, None
+    city = parts[0]
+    province = CITY_TO_PROVINCE.get(_norm_city(city))
+    if province is None and len(parts) > 1:
+        province = parts[1]
+    return city, province
+
+
 class SpainRealEstateScraper(BaseScraper):
     """Scraper for spain-real.estate using httpx with browser fallback."""
 
+    # httpx.Client is thread-safe; the 403 browser fallback is not, so
+    # _fetch_with_browser serializes all page use on _browser_lock
+    SUPPORTS_PARALLEL_ENRICH = True
+
     def __init__(self) -> None:
         super().__init__()
         self._http: httpx.Client | None = None
+        self._http_lock = threading.Lock()
+        self._browser_lock = threading.Lock()
         self._use_browser = False
 
     def _ensure_http(self) -> httpx.Client:
+        # Double-checked: parallel enrich workers race the first fetch, and
+        # two constructions would leak one client unclosed
         if self._http is None:
-            self._http = httpx.Client(
-                headers={
-                    "User-Agent": (
-                        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                        "AppleWebKit/537.36 (KHTML, like Gecko) "
-                        "Chrome/131.0.0.0 Safari/537.36"
-                    ),
-                    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-                    "Accept-Language": "en-US,en;q=0.9,es;q=0.8",
-                    "Accept-Encoding": "gzip, deflate, br",
-                },
-                follow_redirects=True,
-                timeout=30.0,
-            )
+            with self._http_lock:
+                if self._http is None:
+                    self._http = self._build_http()
         return self._http
 
+    def _build_http(self) -> httpx.Client:
+        return httpx.Client(
+            headers={
+                "User-Agent": (
+                    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+                    "AppleWebKit/537.36 (KHTML, like Gecko) "
+                    "Chrome/131.0.0.0 Safari/537.36"
+                ),
+                "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+                "Accept-Language": "en-US,en;q=0.9,es;q=0.8",
+                "Accept-Encoding": "gzip, deflate, br",
+            },
+            follow_redirects=True,
+            timeout=30.0,
+            # Parallel enrich fans out over this one client — keep enough
+            # warm connections that workers never wait on a reconnect
+            limits=httpx.Limits(
+                max_keepalive_connections=32,
+                max_connections=32,
+                keepalive_expiry=60.0,
+            ),
+        )
+
     def close(self) -> None:
         if self._http is not None:
             self._http.close()
@@ -125,16 +226,23 @@ class SpainRealEstateScraper(BaseScraper):
         return self._fetch_with_browser(url)
 
     def _fetch_with_browser(self, url: str) -> str:
-        self._ensure_browser()
-        assert self._page is not None
-        resp = self._page.goto(url, wait_until="domcontentloaded")
-        if resp and resp.status >= 400:
-            raise FetchError(resp.status, url)
-        return self._page.content()
+        # Parallel enrich workers can all end up here once the 403 fallback
+        # flips _use_browser: there is one Playwright page, so browser
+        # fetches (including first launch) are serialized on this lock
+        with self._browser_lock:
+            self._ensure_browser()
+            assert self._page is not None
+            resp = self._page.goto(url, wait_until="domcontentloaded")
+            if resp and resp.status >= 400:
+                raise FetchError(resp.status, url)
+            return self._page.content()
 
     # ── URL construction ─────────────────────────────────────────────
 
+    # Cached: within one run only `page` varies per tab, and repeated runs
+    # (multi-tab, CLI retries) rebuild identical URLs
     @staticmethod
+    @lru_cache(maxsize=1024)
     def build_list_url(
         listing_type: str = "sale",
         tab: str = "apartment",
@@ -143,7 +251,7 @@ class SpainRealEstateScraper(BaseScraper):
         region_id: int = 4120,
     ) -> str:
         """Build a list-page URL for spain-real.estate."""
-        base = f"{BASE_URL}/rent/" if listing_type == "rent" else f"{BASE_URL}/property/"
+        base = _LIST_BASE["rent" if listing_type == "rent" else "sale"]
 
         params: dict[str, str | int] = {"tab": tab}
         if region:
@@ -162,14 +270,16 @@ class SpainRealEstateScraper(BaseScraper):
         """Parse price text like '€ 181 000' or '€ 1 500 monthly'."""
         if not text:
             return None
-        # Remove currency symbols
-        cleaned = text.replace("\u20ac", "").replace("€", "")
-        # Strip period words (no \b — may be glued like "977monthly")
-        cleaned = re.sub(r"(monthly|yearly|weekly)", "", cleaned, flags=re.IGNORECASE)
-        # Remove all whitespace variants (regular, non-breaking, etc.)
-        cleaned = cleaned.replace("\xa0", "").replace("\u00a0", "").replace(" ", "").strip()
+        # One translate pass removes currency symbols and whitespace variants
+        cleaned = text.translate(_PRICE_STRIP)
         if not cleaned:
             return None
+        # Period words (no \b — may be glued like "977monthly"); skip the
+        # regex entirely when nothing but digits survived the translate
+        if not cleaned.replace(".", "").isdigit():
+            cleaned = _RE_PRICE_PERIOD.sub("", cleaned)
+            if not cleaned:
+                return None
         try:
             return float(cleaned)
         except ValueError:
@@ -181,209 +291,261 @@ class SpainRealEstateScraper(BaseScraper):
     @staticmethod
     def guess_sub_category(title: str) -> str | None:
         """Map English terms in the title to model sub_category literals."""
-        t = title.lower()
-        if any(w in t for w in ("apartment", "flat", "penthouse", "duplex", "studio", "townhouse")):
-            return "apartment"
-        if any(w in t for w in ("villa", "house", "chalet", "bungalow", "finca")):
-            return "house"
-        if any(w in t for w in ("commercial", "office", "shop", "hotel", "business", "restaurant")):
-            return "commerce"
-        if any(w in t for w in ("land", "plot")):
-            return "plot"
-        return None
+        return _guess_sub_category(title)
 
     # ── Location extraction ──────────────────────────────────────────
 
     @staticmethod
     def extract_location_from_title(title: str) -> dict[str, str | None]:
         """Extract city and province from 'Type in City, Spain' pattern."""
-        result: dict[str, str | None] = {"municipality": None, "province": None}
-        m = re.search(r"\bin\s+(.+?)(?:,\s*Spain|\s+No\.)", title, re.IGNORECASE)
-        if not m:
-            return result
-        # "Benidorm, Alicante" or just "Valencia"
-        parts = [p.strip() for p in m.group(1).split(",") if p.strip()]
-        if parts:
-            city = parts[0]
-            result["municipality"] = city
-            # Check province lookup
-            province = CITY_TO_PROVINCE.get(city.lower())
-            if province:
-                result["province"] = province
-            elif len(parts) > 1:
-                result["province"] = parts[1]
-        return result
+        municipality, province = _location_from_title(title)
+        return {"municipality": municipality, "province": province}
 
     # ── List page parsing ────────────────────────────────────────────
 
     @staticmethod
-    def parse_total_count(html: str) -> int:
+    def parse_total_count(html: str | HTMLParser) -> int:
         """Extract total listings count from the page."""
-        tree = HTMLParser(html)
+        if isinstance(html, str):
+            # Fast path: anchor on the counter element, not the phrase —
+            # listing copy can contain its own "out of" ("4 out of 5"),
+            # so a bare find would return the wrong number. A windowed
+            # match after the class name skips building a tree; any miss
+            # falls through to the DOM paths below.
+            idx = html.find("total_counter")
+            if idx != -1:
+                m = _RE_OUT_OF.search(html, idx, idx + 160)
+                if m:
+                    return int(m.group(1).replace(",", ""))
+            tree = HTMLParser(html)
+        else:
+            tree = html
         # Try total_counter: "25 - 48 out of 15089"
         counter = tree.css_first("div.total_counter")
         if counter:
-            m = re.search(r"out of\s+([\d,]+)", counter.text())
+            m = _RE_OUT_OF.search(counter.text())
             if m:
                 return int(m.group(1).replace(",", ""))
         # Fallback: objects_list totals: "15089 properties"
         totals = tree.css_first("div.objects_list.totals span")
         if totals:
-            m = re.search(r"([\d,]+)", totals.text())
+            m = _RE_COUNT.search(totals.text())
             if m:
                 return int(m.group(1).replace(",", ""))
         return 0
 
     @staticmethod
-    def parse_list_page(html: str) -> list[dict]:
-        """Parse all listing items from a list page HTML."""
+    def parse_list_page(html: str, skip_ids: set[str] | None = None) -> list[dict]:
+        """Parse all listing items from a list page HTML.
+
+        Items whose source_id is in `skip_ids` are dropped before any
+        per-item parsing work — tabs overlap, so scrape() passes its
+        seen-IDs set here.
+        """
+        # Empty result pages carry no listings at all — skip DOM construction
+        if "data-object" not in html:
+            return []
+        return SpainRealEstateScraper._parse_items(HTMLParser(html), skip_ids)
+
+    @classmethod
+    def _parse_list_page_full(
+        cls, html: str, skip_ids: set[str] | None = None
+    ) -> tuple[list[dict], int, int]:
+        """Parse items, total count, and last page from one DOM build.
+
+        Used on page 1 of each tab, where scrape() needs all three — parsing
+        the document once instead of three times.
+        """
+        if "data-object" not in html:
+            return [], 0, 1
         tree = HTMLParser(html)
+        return (
+            cls._parse_items(tree, skip_ids),
+            cls.parse_total_count(tree),
+            cls.parse_last_page(html),
+        )
+
+    @staticmethod
+    def _parse_items(tree: HTMLParser, skip_ids: set[str] | None = None) -> list[dict]:
         items: list[dict] = []
 
-        for li in tree.css("div.objects-list ul > li[data-object]"):
-            data: dict = {}
+        # Find the listings <ul> once, then walk its children natively —
+        # cheaper than having the CSS engine descend the whole document
+        container = tree.css_first("div.objects-list ul")
+        if container is None:
+            return items
+        for li in container.iter(include_text=False):
+            if li.tag != "li":
+                continue
             obj_id = li.attributes.get("data-object")
             if not obj_id:
                 continue
-            data["source_id"] = str(obj_id)
-
-            # Title + URL
-            title_a = li.css_first("div.title a")
-            if title_a:
-                data["title"] = title_a.text(strip=True)
-                href = title_a.attributes.get("href", "")
-                if href and not href.startswith("http"):
-                    href = BASE_URL + href
-                data["source_url"] = href
-
-            # Price - first <span> inside div.price > span
-            price_div = li.css_first("div.price")
-            if price_div:
-                # Skip sold-out listings
-                sold = price_div.css_first("span.small")
-                if sold and "sold" in sold.text(strip=True).lower():
-                    continue
-
-                spans = price_div.css("span")
-                for span in spans:
-                    txt = span.text(strip=True)
-                    if "\u20ac" in txt or "€" in txt:
-                        data["price_text"] = txt
-                        break
-                # Check if rental and capture period
-                rent_period_el = li.css_first("span.rent-period")
-                if rent_period_el:
+            if skip_ids is not None and obj_id in skip_ids:
+                continue
+            data: dict = {"source_id": str(obj_id)}
+            sold_out = False
+
+            # One selector pass per item collects every node of interest;
+            # the ladder below dispatches on tag + class
+            for node in li.css(_LIST_ITEM_SELECTOR):
+                tag = node.tag
+                if tag == "a" and "title" not in data:
+                    data["title"] = node.text(strip=True)
+                    href = node.attributes.get("href", "")
+                    if href and not href.startswith("http"):
+                        href = BASE_URL + href
+                    data["source_url"] = href
+                elif tag == "b":
+                    parent = node.parent
+                    classes = (parent.attributes.get("class") or "").split() if parent else []
+                    for key in ("rooms", "bedrooms", "bathrooms", "area"):
+                        if key in classes and key not in data:
+                            data[key] = node.text(strip=True)
+                            break
+                elif tag == "span":
+                    # Only span.rent-period matches the selector
                     data["is_rental"] = True
-                    period_text = rent_period_el.text(strip=True).lower()
+                    period_text = node.text(strip=True).lower()
                     if "week" in period_text:
                         data["rent_period"] = "week"
                     elif "month" in period_text:
                         data["rent_period"] = "month"
-
-            # Params
-            for key in ("rooms", "bedrooms", "bathrooms"):
-                el = li.css_first(f"span.{key} b")
-                if el:
-                    data[key] = el.text(strip=True)
-            area_el = li.css_first("span.area b")
-            if area_el:
-                data["area"] = area_el.text(strip=True)
-
-            # Excerpt
-            excerpt = li.css_first("div.excerpt")
-            if excerpt:
-                data["excerpt"] = excerpt.text(strip=True)
-                # Remove trailing "Details" link text
-                if data["excerpt"].endswith("Details"):
-                    data["excerpt"] = data["excerpt"][:-7].rstrip(". ")
-
-            # Thumbnail
-            thumb = li.css_first("img.thumb")
-            if thumb:
-                data["thumbnail"] = thumb.attributes.get("src", "")
-
-            items.append(data)
+                elif tag == "img":
+                    data["thumbnail"] = node.attributes.get("src", "")
+                elif tag == "div":
+                    classes = (node.attributes.get("class") or "").split()
+                    if "price" in classes:
+                        for span in node.css("span"):
+                            txt = span.text(strip=True)
+                            if "small" in (span.attributes.get("class") or "") and "sold" in txt.lower():
+                                sold_out = True
+                                break
+                            if "price_text" not in data and "\u20ac" in txt:
+                                data["price_text"] = txt
+                    elif "excerpt" in classes:
+                        excerpt = node.text(strip=True)
+                        # Remove trailing "Details" link text
+                        if excerpt.endswith("Details"):
+                            excerpt = excerpt[:-7].rstrip(". ")
+                        data["excerpt"] = excerpt
+                if sold_out:
+                    break
+
+            # Sold-out listings are dropped entirely
+            if not sold_out:
+                items.append(data)
 
         return items
 
     @staticmethod
     def parse_last_page(html: str) -> int:
         """Extract the last page number from pagination."""
-        tree = HTMLParser(html)
-        max_page = 1
-        for li in tree.css("ul.pagination li"):
-            a = li.css_first("a")
-            text = a.text(strip=True) if a else li.text(strip=True)
-            try:
-                page_num = int(text)
-                max_page = max(max_page, page_num)
-            except ValueError:
-                continue
-        return max_page
+        # The pagination block is tiny and well-formed — slice it out and scan
+        # for numbers instead of building a tree for the whole page
+        start = html.find('class="pagination"')
+        if start == -1:
+            return 1
+        end = html.find("</ul>", start)
+        if end == -1:
+            end = len(html)
+        return max(
+            (int(m) for m in _RE_PAGE_NUM.findall(html, start, end)),
+            default=1,
+        )
 
     # ── Detail page parsing ──────────────────────────────────────────
 
     @staticmethod
-    def _parse_detail_data(html: str, source_id: str) -> dict:
-        """Parse a property detail page for extra data (coordinates, images, features)."""
-        tree = HTMLParser(html)
+    def _parse_detail_data(html: str | HTMLParser, source_id: str, raw: str | None = None) -> dict:
+        """Parse a property detail page for extra data (coordinates, images, features).
+
+        Accepts raw HTML or an already-built tree so callers that also run
+        `_parse_translation` on the same page only parse the DOM once; `raw`
+        supplies the page source for the OBJECT_MAP_DATA regex in that case.
+        """
+        if isinstance(html, str):
+            tree = HTMLParser(html)
+            raw = html
+        else:
+            tree = html
+            if raw is None:
+                raw = tree.html or ""
         data: dict = {}
 
         # Coordinates from OBJECT_MAP_DATA: {"lat_lng":[{"lat":"41.58","lng":"2.29",...}]}
-        m = re.search(r"OBJECT_MAP_DATA\s*=\s*(\{.*?\});", html, re.DOTALL)
-        if m:
-            try:
-                map_data = json.loads(m.group(1))
-                # The key is "lat_lng" as a string; iterate first entry's list
-                for _key, entries in map_data.items():
-                    if isinstance(entries, list) and entries:
-                        entry = entries[0]
-                        lat = entry.get("lat")
-                        lng = entry.get("lng")
-                        if lat and lng:
-                            data["latitude"] = float(lat)
-                            data["longitude"] = float(lng)
-                        break
-            except (json.JSONDecodeError, ValueError, TypeError):
-                pass
-        # Fallback: schema.org meta tags
-        if "latitude" not in data:
-            lat_el = tree.css_first('meta[itemprop="latitude"]')
-            lng_el = tree.css_first('meta[itemprop="longitude"]')
-            if lat_el and lng_el:
+        idx = raw.find("OBJECT_MAP_DATA")
+        if idx != -1:
+            brace = raw.find("{", idx, idx + 200)
+            if brace != -1:
                 try:
-                    data["latitude"] = float(lat_el.attributes.get("content", ""))
-                    data["longitude"] = float(lng_el.attributes.get("content", ""))
-                except ValueError:
+                    map_data, _ = _JSON_DECODER.raw_decode(raw, brace)
+                    # The key is "lat_lng" as a string; iterate first entry's list
+                    for _key, entries in map_data.items():
+                        if isinstance(entries, list) and entries:
+                            entry = entries[0]
+                            lat = entry.get("lat")
+                            lng = entry.get("lng")
+                            if lat and lng:
+                                data["latitude"] = float(lat)
+                                data["longitude"] = float(lng)
+                            break
+                except (json.JSONDecodeError, ValueError, TypeError, AttributeError):
                     pass
+        # All schema.org meta tags in one selector scan
+        meta: dict[str, str] = {}
+        for m_el in tree.css("meta[itemprop]"):
+            name = m_el.attributes.get("itemprop")
+            if name:
+                meta[name] = m_el.attributes.get("content") or ""
 
-        # Price from schema.org (clean integer, no parsing needed)
-        price_meta = tree.css_first('meta[itemprop="price"]')
-        if price_meta:
+        # Fallback: schema.org meta tags
+        if "latitude" not in data and meta.get("latitude") and meta.get("longitude"):
             try:
-                data["detail_price"] = float(price_meta.attributes.get("content", ""))
+                data["latitude"] = float(meta["latitude"])
+                data["longitude"] = float(meta["longitude"])
             except ValueError:
                 pass
 
-        # Rent period from detail page (uses underscore class: span.rent_period)
-        rent_period_el = tree.css_first("span.rent_period")
-        if rent_period_el:
-            period_text = rent_period_el.text(strip=True).lower()
-            if "week" in period_text:
-                data["rent_period"] = "week"
-            elif "month" in period_text:
-                data["rent_period"] = "month"
+        # Price from schema.org (clean integer, no parsing needed)
+        if meta.get("price"):
+            try:
+                data["detail_price"] = float(meta["price"])
+            except ValueError:
+                pass
 
-        # Gallery images — full-res from data-real attribute
+        # Rent period, gallery images, feature list entries and hreflang
+        # alternates all come back from one combined selector pass
         images: list[str] = []
-        for img in tree.css("#gallery_container .thumbs img"):
-            src = (
-                img.attributes.get("data-real")
-                or img.attributes.get("data-big")
-                or img.attributes.get("src", "")
-            )
-            if src and src not in images:
-                images.append(src)
+        features: list[str] = []
+        translations: dict[str, str] = {}
+        for node in tree.css(_DETAIL_SELECTOR):
+            tag = node.tag
+            if tag == "img":
+                # Gallery images — full-res from data-real attribute
+                src = (
+                    node.attributes.get("data-real")
+                    or node.attributes.get("data-big")
+                    or node.attributes.get("src", "")
+                )
+                if src and src not in images:
+                    images.append(src)
+            elif tag == "li":
+                # Feature lists, wrapped and non-wrapped
+                text = node.text(strip=True)
+                if text:
+                    features.append(text)
+            elif tag == "link":
+                lang = node.attributes.get("hreflang", "")
+                href = node.attributes.get("href", "")
+                if lang and href and lang not in ("x-default",):
+                    translations[lang] = href
+            elif tag == "span" and "rent_period" not in data:
+                period_text = node.text(strip=True).lower()
+                if "week" in period_text:
+                    data["rent_period"] = "week"
+                elif "month" in period_text:
+                    data["rent_period"] = "month"
+
         # Fallback: main image
         if not images:
             main_img = tree.css_first(".main_image img")
@@ -393,13 +555,6 @@ class SpainRealEstateScraper(BaseScraper):
                     images.append(src)
         if images:
             data["images"] = images
-
-        # Features from all feature lists (wrapped and non-wrapped)
-        features: list[str] = []
-        for li_el in tree.css(".features ul li"):
-            text = li_el.text(strip=True)
-            if text:
-                features.append(text)
         if features:
             data["features"] = features
 
@@ -430,30 +585,22 @@ class SpainRealEstateScraper(BaseScraper):
             ("numberOfBedrooms", "bedrooms"),
             ("numberOfBathroomsTotal", "bathrooms"),
         ]:
-            el = tree.css_first(f'meta[itemprop="{prop_name}"]')
-            if el and spec_key not in specs:
-                val = el.attributes.get("content", "")
-                if val:
-                    specs[spec_key] = val
+            val = meta.get(prop_name)
+            if val and spec_key not in specs:
+                specs[spec_key] = val
         if specs:
             data["specs"] = specs
 
-        # Extract hreflang URLs for translations
-        translations: dict[str, str] = {}
-        for link in tree.css('link[rel="alternate"][hreflang]'):
-            lang = link.attributes.get("hreflang", "")
-            href = link.attributes.get("href", "")
-            if lang and href and lang not in ("x-default",):
-                translations[lang] = href
+        # hreflang URLs for translations, collected in the pass above
         if translations:
             data["_translation_urls"] = translations
 
         return data
 
     @staticmethod
-    def _parse_translation(html: str) -> dict[str, str | list[str]]:
+    def _parse_translation(html: str | HTMLParser) -> dict[str, str | list[str]]:
         """Extract title, description, and features from a translated detail page."""
-        tree = HTMLParser(html)
+        tree = HTMLParser(html) if isinstance(html, str) else html
         result: dict[str, str | list[str]] = {}
 
         title_el = tree.css_first("h1")
@@ -486,12 +633,19 @@ class SpainRealEstateScraper(BaseScraper):
         """Convert area/string specs to size/int specs expected by the app."""
         result: dict = {}
 
-        # Rename 'area' → 'size', extract leading number, cast to int
+        # Rename 'area' → 'size': take the leading "123" / "123.5" run with a
+        # plain character walk — inputs like "123 m²" are too short for a regex
         area = specs.get("area") or specs.get("size")
         if area is not None:
-            m = re.match(r"[\d.]+", str(area).strip())
-            if m:
-                result["size"] = round(float(m.group()), 2)
+            s = str(area).strip()
+            i = 0
+            while i < len(s) and (s[i].isdigit() or s[i] == "."):
+                i += 1
+            if i:
+                try:
+                    result["size"] = round(float(s[:i]), 2)
+                except ValueError:
+                    pass
 
         for key in ("bedrooms", "bathrooms"):
             val = specs.get(key)
@@ -517,10 +671,11 @@ class SpainRealEstateScraper(BaseScraper):
         tab: str,
     ) -> Property:
         """Assemble a Property from a parsed list-page item dict."""
+        g = item.get  # called ~20 times below; bind the method once
         # EN title used for sub_category guessing and location extraction
-        en_title = item.get("title", f"Listing {item.get('source_id', 'unknown')}")
+        en_title = g("title") or f"Listing {g('source_id', 'unknown')}"
         # Prefer clean price from detail page schema.org, fall back to list-page text
-        price = item.get("detail_price") or SpainRealEstateScraper.parse_price(item.get("price_text"))
+        price = g("detail_price") or SpainRealEstateScraper.parse_price(g("price_text"))
 
         # Sub-category: from tab first, then from EN title
         sub_cat = TAB_SUB_CATEGORY.get(tab)
@@ -531,51 +686,43 @@ class SpainRealEstateScraper(BaseScraper):
         loc = SpainRealEstateScraper.extract_location_from_title(en_title)
 
         # Primary title/description: prefer ES translation, fall back to EN
-        es_data = item.get("_es", {})
+        es_data = g("_es", {})
         title = es_data.get("title") or en_title
         description = (
             es_data.get("description")
-            or item.get("description")
-            or item.get("excerpt")
+            or g("description")
+            or g("excerpt")
         )
 
         # If rental detected from price, override listing_type
-        actual_listing_type = listing_type
-        if item.get("is_rental"):
-            actual_listing_type = "rent"
+        actual_listing_type = "rent" if g("is_rental") else listing_type
 
         # Specs — collect raw then normalize
-        raw_specs: dict = {}
-        for key in ("rooms", "bedrooms", "bathrooms", "area"):
-            if key in item:
-                raw_specs[key] = item[key]
+        raw_specs: dict = {
+            key: item[key] for key in ("rooms", "bedrooms", "bathrooms", "area") if key in item
+        }
         # Merge any detail-page specs
         if "specs" in item:
             raw_specs.update(item["specs"])
         specs = SpainRealEstateScraper.normalize_specs(raw_specs)
 
-        images = []
-        if item.get("thumbnail"):
-            images.append(item["thumbnail"])
-        if item.get("images"):
-            # Detail images supersede thumbnail
-            images = item["images"]
+        # Detail images supersede the list-page thumbnail
+        images = g("images") or ([item["thumbnail"]] if g("thumbnail") else [])
 
-        source_id = str(item.get("source_id", ""))
+        source_id = str(g("source_id", ""))
         property_id = f"spain-real-estate-{source_id}"
 
         # Build translations
-        translations: list[Translation] = []
-        for tr_data in item.get("_translations", []):
-            translations.append(
-                Translation(
-                    property_id=property_id,
-                    locale=tr_data["locale"],
-                    title=tr_data.get("title"),
-                    description=tr_data.get("description"),
-                    features=tr_data.get("features"),
-                )
+        translations: list[Translation] = [
+            Translation(
+                property_id=property_id,
+                locale=tr_data["locale"],
+                title=tr_data.get("title"),
+                description=tr_data.get("description"),
+                features=tr_data.get("features"),
             )
+            for tr_data in g("_translations", [])
+        ]
 
         return Property(
             listing_type=actual_listing_type,
@@ -583,18 +730,18 @@ class SpainRealEstateScraper(BaseScraper):
             title=title,
             description=description,
             price=price,
-            rent_period=item.get("rent_period"),
+            rent_period=g("rent_period"),
             location=loc.get("municipality"),
             municipality=loc.get("municipality"),
             province=loc.get("province"),
-            latitude=item.get("latitude"),
-            longitude=item.get("longitude"),
+            latitude=g("latitude"),
+            longitude=g("longitude"),
             images=images,
             specs=specs,
-            features=item.get("features", []),
+            features=g("features", []),
             source="spain-real-estate",
             source_id=source_id,
-            source_url=item.get("source_url"),
+            source_url=g("source_url"),
             translations=translations,
         )
 
@@ -607,36 +754,67 @@ class SpainRealEstateScraper(BaseScraper):
         """
         sid = item["source_id"]
         detail_html = self._fetch_page(item["source_url"])
-        detail_data = self._parse_detail_data(detail_html, sid)
+        # One tree serves both the detail-data and EN-translation passes
+        detail_tree = HTMLParser(detail_html)
+        detail_data = self._parse_detail_data(detail_tree, sid, raw=detail_html)
         item.update(detail_data)
 
-        en_tr = self._parse_translation(detail_html)
+        en_tr = self._parse_translation(detail_tree)
         if en_tr.get("title") or en_tr.get("description"):
             item.setdefault("_translations", []).append({"locale": "en", **en_tr})
 
         tr_urls = detail_data.get("_translation_urls", {})
-
-        es_url = tr_urls.get("es")
-        if es_url:
-            self._delay_sync()
-            try:
-                es_html = self._fetch_page(es_url, accept_language="es,es-ES;q=0.9")
-                es_tr = self._parse_translation(es_html)
-                if es_tr.get("title") or es_tr.get("description"):
-                    item["_es"] = es_tr
-            except FetchError:
-                logger.debug("Failed to fetch ES for %s", sid)
-
-        ru_url = tr_urls.get("ru")
-        if ru_url:
+        wanted = [
+            (locale, tr_urls[locale], accept_language)
+            for locale, accept_language in (
+                ("es", "es,es-ES;q=0.9"),
+                ("ru", "ru,ru-RU;q=0.9"),
+            )
+            if locale in tr_urls
+        ]
+
+        # The translation pages are independent, so fetch them concurrently
+        # over the keep-alive client — one delay instead of two serial
+        # delay+round-trip cycles. Browser mode has nothing to parallelize
+        # (one page, serialized on _browser_lock), so fetch sequentially.
+        translations: dict[str, dict] = {}
+        if wanted:
             self._delay_sync()
-            try:
-                ru_html = self._fetch_page(ru_url, accept_language="ru,ru-RU;q=0.9")
-                ru_tr = self._parse_translation(ru_html)
-                if ru_tr.get("title") or ru_tr.get("description"):
-                    item.setdefault("_translations", []).append({"locale": "ru", **ru_tr})
-            except FetchError:
-                logger.debug("Failed to fetch RU for %s", sid)
+            if len(wanted) == 1 or self._use_browser:
+                for locale, url, accept_language in wanted:
+                    try:
+                        html = self._fetch_page(url, accept_language=accept_language)
+                        translations[locale] = self._parse_translation(html)
+                    except FetchError:
+                        logger.debug("Failed to fetch %s for %s", locale.upper(), sid)
+            else:
+                from concurrent.futures import ThreadPoolExecutor
+
+                def fetch(url: str, accept_language: str) -> str:
+                    # _use_browser is re-read here, in the worker: the 403
+                    # fallback can flip it while these futures are in
+                    # flight, and browser fetches then serialize on
+                    # _browser_lock instead of racing the shared page.
+                    return self._fetch_page(url, accept_language=accept_language)
+
+                with ThreadPoolExecutor(max_workers=len(wanted)) as pool:
+                    futures = {
+                        locale: pool.submit(fetch, url, accept_language)
+                        for locale, url, accept_language in wanted
+                    }
+                    for locale, future in futures.items():
+                        try:
+                            translations[locale] = self._parse_translation(future.result())
+                        except FetchError:
+                            logger.debug("Failed to fetch %s for %s", locale.upper(), sid)
+
+        es_tr = translations.get("es")
+        if es_tr and (es_tr.get("title") or es_tr.get("description")):
+            item["_es"] = es_tr
+
+        ru_tr = translations.get("ru")
+        if ru_tr and (ru_tr.get("title") or ru_tr.get("description")):
+            item.setdefault("_translations", []).append({"locale": "ru", **ru_tr})
 
         return item
 
@@ -658,10 +836,8 @@ class SpainRealEstateScraper(BaseScraper):
             logger.debug("No source_url for %s, skipping", prop.source_id)
             return prop
 
-        en_title = next(
-            (t.title for t in prop.translations if t.locale == "en" and t.title),
-            prop.title,
-        )
+        en_tr = prop.translation("en")
+        en_title = (en_tr.title if en_tr else None) or prop.title
         item: dict = {
             "source_id": prop.source_id,
             "title": en_title,
@@ -735,14 +911,21 @@ class SpainRealEstateScraper(BaseScraper):
                         logger.error("Failed to fetch page %d: %s", page, e)
                         break
 
-                    items = self.parse_list_page(html)
+                    # Page 1 also needs totals/pagination — one DOM build covers all
+                    if page == 1:
+                        items, total_count, last_page = self._parse_list_page_full(html, seen_ids)
+                    else:
+                        items = self.parse_list_page(html, seen_ids)
                     if not items:
-                        logger.info("No items on page %d, stopping tab=%s", page, tab)
-                        break
+                        # Distinguish a truly empty page (end of results) from
+                        # one where every listing was seen in an earlier tab
+                        if "data-object" not in html:
+                            logger.info("No items on page %d, stopping tab=%s", page, tab)
+                            break
+                        logger.debug("All items on page %d already seen, skipping", page)
 
                     # On first page, determine total pages
                     if page == 1:
-                        total_count = self.parse_total_count(html)
                         if total_count:
                             total_pages = math.ceil(total_count / ITEMS_PER_PAGE)
                             logger.info(
@@ -750,7 +933,7 @@ class SpainRealEstateScraper(BaseScraper):
                                 tab, total_count, total_pages,
                             )
                         else:
-                            total_pages = self.parse_last_page(html)
+                            total_pages = last_page
                             logger.info("Tab %s: last page = %d", tab, total_pages)
 
                     for item in items:
@@ -0,0 +1,14 @@
+"""Shared test helpers."""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from pathlib import Path
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+
+@lru_cache(maxsize=32)
+def read_fixture(name: str) -> str:
+    """Read a fixture file once per test session."""
+    return (FIXTURES_DIR / name).read_text(encoding="utf-8")
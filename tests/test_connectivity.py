@@ -10,7 +10,10 @@ import pytest
 from src.scrapers.spain_real_estate import SpainRealEstateScraper
 
 
-@pytest.fixture
+# One scraper for the whole module: the httpx tests then share a warm
+# TLS connection (as a real scrape would) and the browser test pays
+# Patchright startup once instead of every scraper teardown re-closing it
+@pytest.fixture(scope="module")
 def scraper():
     s = SpainRealEstateScraper()
     yield s
@@ -8,11 +8,14 @@ from pathlib import Path
 import pytest
 
 from src.scrapers.idealista import IdealistaScraper
+from tests.conftest import read_fixture
 
 FIXTURES_DIR = Path(__file__).parent / "fixtures"
 
 
-@pytest.fixture
+# Module scope: these tests only exercise pure parsing helpers, so one
+# scraper instance (no browser, no network) can serve them all
+@pytest.fixture(scope="module")
 def scraper():
     s = IdealistaScraper()
     yield s
@@ -79,6 +82,11 @@ class TestJsToJson:
         result = json.loads(scraper._js_to_json(js))
         assert result == {"a": None, "b": 1}
 
+    def test_escaped_single_quote(self, scraper):
+        js = "{t: 'it\\'s nice'}"
+        result = json.loads(scraper._js_to_json(js))
+        assert result == {"t": "it's nice"}
+
     def test_mixed(self, scraper):
         js = "{initialPrice: 150000, type: 'sale', extra: undefined,}"
         result = json.loads(scraper._js_to_json(js))
@@ -86,6 +94,13 @@ class TestJsToJson:
         assert result["type"] == "sale"
         assert result["extra"] is None
 
+    def test_safe_load_strict_json(self, scraper):
+        # Already-valid JSON takes the direct parse path
+        assert scraper._safe_load('{"initialPrice": 150000}') == {"initialPrice": 150000}
+
+    def test_safe_load_js_fallback(self, scraper):
+        assert scraper._safe_load("{price: 150000,}") == {"price": 150000}
+
 
 # ── Feature parsing tests ─────────────────────────────────────────────
 
@@ -345,7 +360,7 @@ class TestDetailPageParsing:
     )
     def test_real_fixture(self, scraper):
         """Test against a real saved HTML fixture (if available)."""
-        html = (FIXTURES_DIR / "detail.html").read_text(encoding="utf-8")
+        html = read_fixture("detail.html")
         prop = scraper.parse_detail_page(html, "fixture_test", "sale")
         assert prop is not None
         assert prop.title
@@ -7,6 +7,7 @@ from pathlib import Path
 import pytest
 
 from src.scrapers.spain_real_estate import SpainRealEstateScraper
+from tests.conftest import read_fixture
 
 S = SpainRealEstateScraper
 
@@ -17,78 +18,60 @@ FIXTURES_DIR = Path(__file__).parent / "fixtures"
 
 
 class TestParsePrice:
-    def test_basic_eur(self):
-        assert S.parse_price("\u20ac 181 000") == 181000.0
-
-    def test_large_amount(self):
-        assert S.parse_price("\u20ac 2 500 000") == 2500000.0
-
-    def test_monthly(self):
-        assert S.parse_price("\u20ac 1 500 monthly") == 1500.0
-
-    def test_non_breaking_spaces(self):
-        assert S.parse_price("\u20ac\xa0995\xa0000") == 995000.0
-
-    def test_empty(self):
-        assert S.parse_price("") is None
-        assert S.parse_price(None) is None
-
-    def test_euro_sign(self):
-        assert S.parse_price("€ 370 000") == 370000.0
-
-    def test_glued_monthly(self):
-        assert S.parse_price("€ 1\xa0977monthly") == 1977.0
+    @pytest.mark.parametrize(
+        ("text", "expected"),
+        [
+            ("\u20ac 181 000", 181000.0),
+            ("\u20ac 2 500 000", 2500000.0),
+            ("\u20ac 1 500 monthly", 1500.0),
+            ("\u20ac\xa0995\xa0000", 995000.0),
+            ("€ 370 000", 370000.0),
+            ("€ 1\xa0977monthly", 1977.0),
+            ("", None),
+            (None, None),
+        ],
+    )
+    def test_parse_price(self, text, expected):
+        assert S.parse_price(text) == expected
 
 
 # ── Sub-category guessing ───────────────────────────────────────────
 
 
 class TestGuessSubCategory:
-    def test_apartment(self):
-        assert S.guess_sub_category("Apartment in Valencia, Spain") == "apartment"
-
-    def test_flat(self):
-        assert S.guess_sub_category("Flat in Barcelona, Spain") == "apartment"
-
-    def test_penthouse(self):
-        assert S.guess_sub_category("Penthouse in Alicante, Spain") == "apartment"
-
-    def test_villa(self):
-        assert S.guess_sub_category("Villa in Benidorm, Spain") == "house"
-
-    def test_commercial(self):
-        assert S.guess_sub_category("Commercial property in Valencia") == "commerce"
-
-    def test_land(self):
-        assert S.guess_sub_category("Land plot in Denia, Spain") == "plot"
-
-    def test_unknown(self):
-        assert S.guess_sub_category("Property No. 12345") is None
+    @pytest.mark.parametrize(
+        ("title", "expected"),
+        [
+            ("Apartment in Valencia, Spain", "apartment"),
+            ("Flat in Barcelona, Spain", "apartment"),
+            ("Penthouse in Alicante, Spain", "apartment"),
+            ("Villa in Benidorm, Spain", "house"),
+            ("Commercial property in Valencia", "commerce"),
+            ("Land plot in Denia, Spain", "plot"),
+            ("Property No. 12345", None),
+        ],
+    )
+    def test_guess_sub_category(self, title, expected):
+        assert S.guess_sub_category(title) == expected
 
 
 # ── Location extraction ─────────────────────────────────────────────
 
 
 class TestExtractLocation:
-    def test_valencia(self):
-        loc = S.extract_location_from_title("Apartment in Valencia, Spain 2 bedrooms, No. 12345")
-        assert loc["municipality"] == "Valencia"
-        assert loc["province"] == "Valencia"
-
-    def test_alicante(self):
-        loc = S.extract_location_from_title("Villa in Alicante, Spain No. 99999")
-        assert loc["municipality"] == "Alicante"
-        assert loc["province"] == "Alicante"
-
-    def test_benidorm_maps_to_alicante(self):
-        loc = S.extract_location_from_title("Apartment in Benidorm, Spain 3 bedrooms, No. 55555")
-        assert loc["municipality"] == "Benidorm"
-        assert loc["province"] == "Alicante"
-
-    def test_no_match(self):
-        loc = S.extract_location_from_title("Some weird title without pattern")
-        assert loc["municipality"] is None
-        assert loc["province"] is None
+    @pytest.mark.parametrize(
+        ("title", "municipality", "province"),
+        [
+            ("Apartment in Valencia, Spain 2 bedrooms, No. 12345", "Valencia", "Valencia"),
+            ("Villa in Alicante, Spain No. 99999", "Alicante", "Alicante"),
+            ("Apartment in Benidorm, Spain 3 bedrooms, No. 55555", "Benidorm", "Alicante"),
+            ("Some weird title without pattern", None, None),
+        ],
+    )
+    def test_extract_location(self, title, municipality, province):
+        loc = S.extract_location_from_title(title)
+        assert loc["municipality"] == municipality
+        assert loc["province"] == province
 
 
 # ── List page parsing ───────────────────────────────────────────────
@@ -264,8 +247,8 @@ class TestParseDetailPage:
         </script>
         """
         data = S._parse_detail_data(html, "12345")
-        assert data["latitude"] == pytest.approx(41.583766)
-        assert data["longitude"] == pytest.approx(2.2898)
+        assert data["latitude"] == 41.583766
+        assert data["longitude"] == 2.2898
 
     def test_coordinates_from_schema(self):
         html = """
@@ -275,8 +258,8 @@ class TestParseDetailPage:
         </div>
         """
         data = S._parse_detail_data(html, "12345")
-        assert data["latitude"] == pytest.approx(39.4699)
-        assert data["longitude"] == pytest.approx(-0.3763)
+        assert data["latitude"] == 39.4699
+        assert data["longitude"] == -0.3763
 
     def test_price_from_schema(self):
         html = '<meta itemprop="price" content="698000">'
@@ -749,7 +732,7 @@ class TestRealFixture:
         reason="No fixture file at tests/fixtures/spain_real_estate_list.html",
     )
     def test_real_list_page(self):
-        html = (FIXTURES_DIR / "spain_real_estate_list.html").read_text(encoding="utf-8")
+        html = read_fixture("spain_real_estate_list.html")
         items = S.parse_list_page(html)
         assert len(items) > 0
         for item in items:
@@ -761,7 +744,7 @@ class TestRealFixture:
         reason="No fixture file at tests/fixtures/spain_real_estate_list_valencia.html",
     )
     def test_real_valencia_list(self):
-        html = (FIXTURES_DIR / "spain_real_estate_list_valencia.html").read_text(encoding="utf-8")
+        html = read_fixture("spain_real_estate_list_valencia.html")
         items = S.parse_list_page(html)
         assert len(items) > 0
         total = S.parse_total_count(html)